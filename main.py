@@ -1,12 +1,25 @@
 import sys
 import os
+import codecs
+import gc
+import gzip
+import hashlib
+import mmap
+import shlex
 import shutil
-import glob
 import re
 import json
+import multiprocessing
 import zipfile
 import tarfile
-from datetime import datetime
+import threading
+import time
+from array import array
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from contextlib import contextmanager
+from bisect import bisect_left
+from itertools import starmap
+from datetime import datetime, timedelta
 
 # Media/PDF/DOCX preview deps
 import vlc
@@ -16,15 +29,18 @@ import docx  # python-docx
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QTreeWidget, QTreeWidgetItem, QTabWidget,
     QTextEdit, QToolBar, QAction, QFileDialog, QWidget, QHBoxLayout, QVBoxLayout,
-    QTableWidgetItem, QStatusBar, QTabBar, QPushButton, QComboBox, QLabel,
-    QScrollArea, QSplitter, QTableWidget, QLineEdit, QTableView, QRadioButton,
+    QStatusBar, QTabBar, QPushButton, QComboBox, QLabel,
+    QScrollArea, QSplitter, QLineEdit, QTableView, QRadioButton,
     QButtonGroup, QGroupBox, QMessageBox, QListWidget, QListWidgetItem, QFrame,
-    QSlider
+    QSlider, QSpinBox, QHeaderView, QCheckBox, QProgressBar
 )
 import piexif
 from PIL import Image
-from PyQt5.QtGui import QFont, QPixmap, QStandardItemModel, QStandardItem, QImage
-from PyQt5.QtCore import Qt, QSize, QSortFilterProxyModel, QPropertyAnimation, QRect, QEasingCurve, QTimer
+from PyQt5.QtGui import QFont, QPixmap, QImage
+from PyQt5.QtCore import (
+    Qt, QSize, QSortFilterProxyModel, QPropertyAnimation, QRect, QEasingCurve, QTimer,
+    QObject, QRunnable, QThreadPool, pyqtSignal, QAbstractTableModel, QModelIndex
+)
 
 from ppadb.client import Client as AdbClient
 from langchain_openai import ChatOpenAI
@@ -38,25 +54,1277 @@ load_dotenv()
 # ============================================================
 
 USAGE_EVENT_RE = re.compile(r'time="([^"]+)"\s+type=([A-Z_]+)\s+package=([\w\.\d]+)(.*)')
+# The same fields kept within one line, so findall can scan a whole block of a dump at once.
+USAGE_EVENT_BLOCK_RE = re.compile(r'time="([^"\n]+)"[^\S\n]+type=([A-Z_]+)[^\S\n]+package=([\w.]+)([^\n]*)')
+USAGE_EXTRA_FIELD_RE = re.compile(r'(\w+)=("[^"]*"|\S*)')
+
+USAGE_DUMP_CMD = "dumpsys usagestats"
+
+
+# Local-midnight epoch per "YYYY-MM-DD" prefix seen in dumps; None for an
+# unparsable day or one that isn't 24h long (DST change), which take the slow path.
+_USAGE_DAY_EPOCHS = {}
+
+
+def _usage_day_epoch(day):
+    try:
+        start = datetime(int(day[0:4]), int(day[5:7]), int(day[8:10]))
+        midnight, next_midnight = start.timestamp(), (start + timedelta(days=1)).timestamp()
+    except (ValueError, TypeError, OverflowError):
+        return None
+    return int(midnight) if next_midnight - midnight == 86400 else None
+
+
+def usage_time_to_epoch(text):
+    """Converts a dumpsys "YYYY-MM-DD HH:MM:SS" time to epoch seconds, or None."""
+    day = text[:10]
+    midnight = _USAGE_DAY_EPOCHS.get(day, False)
+    if midnight is False:
+        midnight = _USAGE_DAY_EPOCHS[day] = _usage_day_epoch(day)
+    try:
+        hour, minute, second = int(text[11:13]), int(text[14:16]), int(text[17:19])
+        if midnight is not None and 0 <= hour < 24 and 0 <= minute < 60 and 0 <= second < 60:
+            return midnight + hour * 3600 + minute * 60 + second
+        return int(datetime(int(text[0:4]), int(text[5:7]), int(text[8:10]),
+                            hour, minute, second).timestamp())
+    except (ValueError, IndexError, TypeError):
+        return None
+
+
+def _parse_int(value):
+    try:
+        return int(value, 0)
+    except (TypeError, ValueError):
+        return None
+
+
+# Bumped whenever the serialized UsageEvent layout changes (invalidates resumable spools).
+USAGE_EVENT_SCHEMA = 2
+
+
+class UsageEvent:
+    """
+    One parsed usage event. `time` is epoch seconds (-1 when the dump's
+    timestamp could not be parsed); the common extra fields are split into
+    typed attributes and only unrecognised text is kept in `extra_info`.
+    Events wrapped from dump lines (from_match) keep the raw time text and
+    field tail and decode each the first time it is read.
+    """
+    __slots__ = ("event_type", "package", "_time", "_extras", "_time_text", "_tail")
+
+    # dumpsys field name -> attribute, converter
+    EXTRA_FIELDS = {
+        "class": ("class_name", sys.intern),
+        "instanceId": ("instance_id", _parse_int),
+        "taskRootPackage": ("task_root_package", sys.intern),
+        "flags": ("flags", _parse_int),
+    }
+    # Every attribute, in key() order.
+    FIELDS = ("time", "event_type", "package", "class_name", "instance_id",
+              "task_root_package", "flags", "extra_info")
+    NO_EXTRAS = (None, None, None, None, "")
+
+    def __init__(self, time, event_type, package, class_name=None, instance_id=None,
+                 task_root_package=None, flags=None, extra_info=""):
+        self._time = time
+        self.event_type = event_type
+        self.package = package
+        self._extras = (class_name, instance_id, task_root_package, flags, extra_info)
+
+    @staticmethod
+    def from_match(m):
+        """Wraps a USAGE_EVENT_RE match; its time and extra fields are decoded on first access."""
+        return _DumpUsageEvent(*m.groups())
+
+    @classmethod
+    def split_extras(cls, tail):
+        """
+        Splits the text after package=... into the EXTRA_FIELDS values and
+        the leftover extra_info. Unquoted tails (everything dumpsys prints
+        itself) are split on whitespace in one pass; USAGE_EXTRA_FIELD_RE
+        only runs when a value is quoted.
+        """
+        if not tail or tail.isspace():
+            return cls.NO_EXTRAS
+        fields, values, rest = cls.EXTRA_FIELDS, {}, []
+        if '"' in tail:
+            pos = 0
+            for fm in USAGE_EXTRA_FIELD_RE.finditer(tail):
+                field = fields.get(fm.group(1))
+                if field is None:
+                    continue
+                values[field[0]] = field[1](fm.group(2).strip('"'))
+                rest.append(tail[pos:fm.start()])
+                pos = fm.end()
+            rest.append(tail[pos:])
+            rest = " ".join(rest).split()
+        else:
+            for token in tail.split():
+                name, sep, value = token.partition("=")
+                field = fields.get(name) if sep else None
+                if field is None:
+                    rest.append(token)
+                else:
+                    values[field[0]] = field[1](value)
+        return tuple(values.get(attr) for attr, _ in fields.values()) + (" ".join(rest),)
+
+    @property
+    def time(self):
+        if self._time is None:
+            ts = usage_time_to_epoch(self._time_text)
+            self._time = -1 if ts is None else ts
+        return self._time
+
+    def _decoded_extras(self):
+        if self._extras is None:
+            self._extras = self.split_extras(self._tail)
+        return self._extras
+
+    @property
+    def class_name(self):
+        return self._decoded_extras()[0]
+
+    @property
+    def instance_id(self):
+        return self._decoded_extras()[1]
+
+    @property
+    def task_root_package(self):
+        return self._decoded_extras()[2]
+
+    @property
+    def flags(self):
+        return self._decoded_extras()[3]
+
+    @property
+    def extra_info(self):
+        return self._decoded_extras()[4]
+
+    @property
+    def time_text(self):
+        if self.time < 0:
+            return ""
+        return datetime.fromtimestamp(self.time).strftime("%Y-%m-%d %H:%M:%S")
+
+    def extra_text(self):
+        """The extra fields rendered back in dumpsys key=value form."""
+        parts = []
+        for name, (attr, _) in self.EXTRA_FIELDS.items():
+            value = getattr(self, attr)
+            if value is not None:
+                parts.append(f"{name}={hex(value) if name == 'flags' else value}")
+        if self.extra_info:
+            parts.append(self.extra_info)
+        return " ".join(parts)
+
+    def key(self):
+        """Identity of the event within its second, for de-duplicating re-acquired dumps."""
+        return "\x1f".join(str(getattr(self, attr)) for attr in self.FIELDS)
+
+    def to_dict(self):
+        d = {"time": self.time_text, "epoch": self.time, "event_type": self.event_type, "package": self.package}
+        for name, (attr, _) in self.EXTRA_FIELDS.items():
+            value = getattr(self, attr)
+            if value is not None:
+                d[attr] = value
+        d["extra_info"] = self.extra_info
+        return d
+
+
+class _DumpUsageEvent(UsageEvent):
+    """A UsageEvent built from a dump line's raw (time, type, package, tail) text."""
+    __slots__ = ()
+
+    def __init__(self, time_text, event_type, package, tail):
+        self._time = self._extras = None
+        self._time_text = time_text
+        self.event_type = sys.intern(event_type)
+        self.package = sys.intern(package)
+        self._tail = tail
+
+
+def iter_usage_events(lines):
+    # map/filter keep the per-line loop in C; the regex's literal time=" prefix rejects other lines early.
+    return map(UsageEvent.from_match, filter(None, map(USAGE_EVENT_RE.search, lines)))
+
+
+def open_usage_dump(path, mode="rt"):
+    if path.endswith(".gz"):
+        return gzip.open(path, mode, encoding="utf-8", errors="replace")
+    return open(path, mode, encoding="utf-8", errors="replace")
+
+
+# File names a saved usage dump can have (plain / gzip); other usage_dump* files (e.g. the .idx sidecar) are not dumps.
+USAGE_DUMP_NAMES = ("usage_dump.txt", "usage_dump.txt.gz")
+
+
+def usage_dump_path(out_dir, compress=False):
+    return os.path.join(out_dir, USAGE_DUMP_NAMES[1] if compress else USAGE_DUMP_NAMES[0])
+
+
+def find_usage_dump(out_dir):
+    for compress in (False, True):
+        path = usage_dump_path(out_dir, compress)
+        if os.path.exists(path):
+            return path
+    return None
+
+
+@contextmanager
+def gc_paused():
+    """
+    Suspends the cyclic collector while a parse builds many small acyclic
+    records; its repeated passes over the growing list cost more than the parse.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+# Characters of a dump parse_usage_events hands to one findall.
+USAGE_READ_BLOCK = 1 << 20
+
 
 def parse_usage_events(file_path):
     events = []
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            for line in f:
-                m = USAGE_EVENT_RE.search(line)
-                if m:
-                    events.append({
-                        "time": m.group(1),
-                        "event_type": m.group(2),
-                        "package": m.group(3),
-                        "extra_info": (m.group(4) or "").strip()
-                    })
+        with open_usage_dump(file_path) as f, gc_paused():
+            for block in iter(lambda: f.read(USAGE_READ_BLOCK), ""):
+                block += f.readline()
+                events.extend(starmap(_DumpUsageEvent, USAGE_EVENT_BLOCK_RE.findall(block)))
     except Exception:
         pass
     return events
 
 
+# Byte size of the slices index_usage_dump_parallel hands to each worker.
+USAGE_PARSE_CHUNK = 16 * 1024 * 1024
+# Below this a single in-process scan beats starting worker processes.
+USAGE_PARALLEL_MIN_BYTES = 256 * 1024 * 1024
+
+# Event fields kept within one line, as bytes, for indexing a dump.
+USAGE_EVENT_BYTES_RE = re.compile(rb'time="([^"\n]+)"[^\S\n]+type=([A-Z_]+)[^\S\n]+package=([\w.]+)')
+
+
+def _usage_chunk_bounds(file_path, chunk_size):
+    """Splits a file into (start, end) byte ranges that begin and end on line boundaries."""
+    size = os.path.getsize(file_path)
+    bounds, start = [], 0
+    with open(file_path, "rb") as f:
+        while start < size:
+            f.seek(min(start + chunk_size, size))
+            f.readline()
+            end = min(f.tell(), size)
+            bounds.append((start, end))
+            start = end
+    return bounds
+
+
+def _index_usage_chunk(data, base=0):
+    """
+    Scans dump bytes for event lines. Returns an index batch: each line's
+    byte offset (plus `base`) and epoch time (-1 = unparsable), and its
+    event type and package as ids into the batch's own name lists.
+    """
+    batch = {"offset": array("q"), "time": array("q"), "type_id": array("H"), "package_id": array("I"),
+             "event_types": [], "packages": []}
+    add_offset, add_time = batch["offset"].append, batch["time"].append
+    add_type, add_package = batch["type_id"].append, batch["package_id"].append
+    type_ids, package_ids = {}, {}
+    for m in USAGE_EVENT_BYTES_RE.finditer(data):
+        time_text, event_type, package = m.groups()
+        ts = usage_time_to_epoch(time_text)
+        add_offset(base + data.rfind(b"\n", 0, m.start()) + 1)
+        add_time(-1 if ts is None else ts)
+        idx = type_ids.get(event_type)
+        if idx is None:
+            idx = type_ids[event_type] = len(batch["event_types"])
+            batch["event_types"].append(event_type.decode())
+        add_type(idx)
+        idx = package_ids.get(package)
+        if idx is None:
+            idx = package_ids[package] = len(batch["packages"])
+            batch["packages"].append(package.decode())
+        add_package(idx)
+    return batch
+
+
+def _index_usage_range(args):
+    """Worker: indexes one line-aligned byte range of a dump."""
+    file_path, start, end = args
+    with open(file_path, "rb") as f:
+        f.seek(start)
+        return _index_usage_chunk(f.read(end - start), start)
+
+
+def _available_cpus():
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def index_usage_dump_parallel(file_path, workers=None, chunk_size=USAGE_PARSE_CHUNK):
+    """
+    Indexes a large plain-text usage dump in line-aligned chunks on a process
+    pool; returns the index batches in file order. Workers are spawned, not
+    forked, so the GUI process's threads and locks never leak into them.
+    """
+    jobs = [(file_path, start, end) for start, end in _usage_chunk_bounds(file_path, chunk_size)]
+    workers = min(workers or _available_cpus(), len(jobs))
+    if workers <= 1:
+        return [_index_usage_range(job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as executor:
+        return list(executor.map(_index_usage_range, jobs))
+
+
+class UsageDumpIndex:
+    """
+    Memory-mapped reader over a plain-text usage dump with a persistent
+    sidecar index (<dump>.idx) holding, per event line, its byte offset,
+    epoch time, package id and event-type id, plus the rows in time order
+    and grouped by package. A dump tab's model takes its time, event and
+    package columns straight from these arrays and reads a line back from
+    the dump only when its extra fields are shown or filtered on; time-range
+    and package queries are answered from the index alone.
+    The index is loaded from the sidecar, or rebuilt when missing, when
+    `rebuild` is set, or when the dump's size or mtime no longer match;
+    dumps past USAGE_PARALLEL_MIN_BYTES are indexed on a process pool.
+    """
+    INDEX_VERSION = 3
+
+    def __init__(self, path, rebuild=False):
+        self.path = path
+        self.index_path = path + ".idx"
+        self._file = open(path, "rb")
+        st = os.fstat(self._file.fileno())
+        self._stamp = {"size": st.st_size, "mtime_ns": st.st_mtime_ns}
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if st.st_size else b""
+        if rebuild or not self._load():
+            self._build()
+            self._save()
+        self._package_index = {p: i for i, p in enumerate(self.packages)}
+        self.sorted_times = array("q", (self.times[r] for r in self.time_order))
+
+    def close(self):
+        """Releases the dump; the row queries keep working from the in-memory index."""
+        if isinstance(self._mm, mmap.mmap):
+            self._mm.close()
+        self._file.close()
+
+    def __len__(self):
+        return len(self.offsets)
+
+    # ---------- build / persist ----------
+
+    def _new_arrays(self):
+        self.offsets, self.times = array("q"), array("q")
+        self.package_ids, self.type_ids = array("I"), array("H")
+        self.packages, self.event_types = [], []
+
+    @staticmethod
+    def _name_id(name, names, ids):
+        idx = ids.get(name)
+        if idx is None:
+            idx = ids[name] = len(names)
+            names.append(name)
+        return idx
+
+    def _build(self):
+        if self._stamp["size"] >= USAGE_PARALLEL_MIN_BYTES and _available_cpus() > 1:
+            batches = index_usage_dump_parallel(self.path)
+        else:
+            batches = [_index_usage_chunk(self._mm)]
+        self._new_arrays()
+        package_ids, type_ids = {}, {}
+        for batch in batches:
+            # Batch-local name ids -> index-wide ids.
+            types = [self._name_id(t, self.event_types, type_ids) for t in batch["event_types"]]
+            packages = [self._name_id(p, self.packages, package_ids) for p in batch["packages"]]
+            self.offsets.extend(batch["offset"])
+            self.times.extend(batch["time"])
+            self.type_ids.extend(map(types.__getitem__, batch["type_id"]))
+            self.package_ids.extend(map(packages.__getitem__, batch["package_id"]))
+        self._order_rows()
+
+    def _order_rows(self):
+        self.time_order = array("I", sorted(range(len(self.times)), key=self.times.__getitem__))
+        buckets = [array("I") for _ in self.packages]
+        for row, pid in enumerate(self.package_ids):
+            buckets[pid].append(row)
+        self.package_order, self.package_starts = array("I"), [0]
+        for rows in buckets:
+            self.package_order.extend(rows)
+            self.package_starts.append(len(self.package_order))
+
+    def _arrays(self):
+        return (self.offsets, self.times, self.package_ids, self.type_ids, self.time_order, self.package_order)
+
+    def _save(self):
+        header = {"version": self.INDEX_VERSION, **self._stamp, "count": len(self.offsets),
+                  "packages": self.packages, "package_starts": self.package_starts,
+                  "event_types": self.event_types}
+        try:
+            with open(self.index_path, "wb") as f:
+                f.write(json.dumps(header).encode() + b"\n")
+                for arr in self._arrays():
+                    f.write(arr.tobytes())
+        except OSError:
+            pass
+
+    def _load(self):
+        try:
+            with open(self.index_path, "rb") as f:
+                header = json.loads(f.readline())
+                if header.get("version") != self.INDEX_VERSION or any(header.get(k) != v for k, v in self._stamp.items()):
+                    return False
+                count = header["count"]
+                self._new_arrays()
+                self.time_order, self.package_order = array("I"), array("I")
+                for arr in self._arrays():
+                    arr.frombytes(f.read(count * arr.itemsize))
+                    if len(arr) != count:
+                        return False
+                self.packages = header["packages"]
+                self.package_starts = header["package_starts"]
+                self.event_types = header["event_types"]
+                return True
+        except (OSError, ValueError, KeyError):
+            return False
+
+    # ---------- queries ----------
+
+    def line_at(self, offset):
+        end = self._mm.find(b"\n", offset)
+        return self._mm[offset:end if end >= 0 else len(self._mm)].decode("utf-8", errors="replace")
+
+    def event_at(self, row):
+        """The full event of `row`, parsed from its line in the dump."""
+        m = USAGE_EVENT_RE.search(self.line_at(self.offsets[row]))
+        if m is None:
+            return UsageEvent(self.times[row], self.event_types[self.type_ids[row]],
+                              self.packages[self.package_ids[row]])
+        return UsageEvent.from_match(m)
+
+    def rows_between(self, start=None, end=None):
+        """Event rows with start <= epoch < end, in time order (binary search on the index)."""
+        lo = 0 if start is None else bisect_left(self.sorted_times, start)
+        hi = len(self.sorted_times) if end is None else bisect_left(self.sorted_times, end)
+        return self.time_order[lo:hi]
+
+    def rows_for_package(self, package):
+        """Event rows of `package` in file order, straight from the per-package row list."""
+        pid = self._package_index.get(package)
+        if pid is None:
+            return array("I")
+        return self.package_order[self.package_starts[pid]:self.package_starts[pid + 1]]
+
+
+def tee_lines(lines, path):
+    """Passes lines through while writing them to `path` (gzip when it ends in .gz)."""
+    with open_usage_dump(path, "wt") as f:
+        for line in lines:
+            f.write(line + "\n")
+            yield line
+
+
+def stream_usage_events(lines, tee_path=None):
+    """
+    Parses `dumpsys usagestats` output as it arrives over the shell socket,
+    optionally keeping a local copy; nothing is written to the device.
+    """
+    if tee_path:
+        os.makedirs(os.path.dirname(tee_path), exist_ok=True)
+        other = usage_dump_path(os.path.dirname(tee_path), not tee_path.endswith(".gz"))
+        if os.path.exists(other):
+            os.remove(other)
+        lines = tee_lines(lines, tee_path)
+    return iter_usage_events(lines)
+
+
+# Event types that open / close an activity's foreground interval. The
+# MOVE_TO_* names are what pre-Q releases report for the same transitions.
+SESSION_OPEN_EVENTS = {"ACTIVITY_RESUMED", "MOVE_TO_FOREGROUND"}
+SESSION_CLOSE_EVENTS = {"ACTIVITY_PAUSED", "ACTIVITY_STOPPED", "MOVE_TO_BACKGROUND"}
+SCREEN_ON_EVENTS = {"SCREEN_INTERACTIVE"}
+SCREEN_OFF_EVENTS = {"SCREEN_NON_INTERACTIVE"}
+DEVICE_DOWN_EVENTS = {"DEVICE_SHUTDOWN", "DEVICE_STARTUP"}
+
+
+class UsageSession:
+    """
+    One reconstructed interval: an app in the foreground (`kind` "app") or the
+    screen being interactive (`kind` "screen"). `closed_by` is the event type
+    that ended it, or "OPEN" when the dump ended before it did.
+    """
+    __slots__ = ("kind", "package", "class_name", "start", "end", "closed_by")
+
+    def __init__(self, kind, package, class_name, start, end=None, closed_by=None):
+        self.kind = kind
+        self.package = package
+        self.class_name = class_name
+        self.start = start
+        self.end = end
+        self.closed_by = closed_by
+
+    @property
+    def seconds(self):
+        return max(0, self.end - self.start)
+
+    def to_dict(self):
+        return {
+            "kind": self.kind,
+            "package": self.package,
+            "class_name": self.class_name,
+            "start": datetime.fromtimestamp(self.start).strftime("%Y-%m-%d %H:%M:%S"),
+            "end": datetime.fromtimestamp(self.end).strftime("%Y-%m-%d %H:%M:%S"),
+            "seconds": self.seconds,
+            "closed_by": self.closed_by,
+        }
+
+
+def _time_ordered(events):
+    """Events with a valid timestamp in time order; a sort only happens when the dump isn't already ordered."""
+    events = [ev for ev in events if ev.time >= 0]
+    if any(events[i].time > events[i + 1].time for i in range(len(events) - 1)):
+        events.sort(key=lambda ev: ev.time)
+    return events
+
+
+def build_usage_sessions(events):
+    """
+    Reconstructs foreground app sessions and screen-on sessions in one pass
+    over time-ordered usage events. Activities are paired RESUMED -> PAUSED /
+    STOPPED by (package, instanceId or class); screen-off and shutdown close
+    everything still open. Duplicate events (the same event repeated by
+    overlapping dumpsys intervals) are skipped.
+    """
+    sessions, open_apps, screen = [], {}, None
+    now, seen_now = None, set()
+
+    def close_apps(when, reason):
+        for s in open_apps.values():
+            s.end, s.closed_by = when, reason
+            sessions.append(s)
+        open_apps.clear()
+
+    for ev in _time_ordered(events):
+        if ev.time != now:
+            now, seen_now = ev.time, set()
+        key = (ev.event_type, ev.package, ev.class_name, ev.instance_id)
+        if key in seen_now:
+            continue
+        seen_now.add(key)
+        kind = ev.event_type
+        if kind in SESSION_OPEN_EVENTS:
+            app_key = (ev.package, ev.instance_id if ev.instance_id is not None else ev.class_name)
+            if app_key not in open_apps:
+                open_apps[app_key] = UsageSession("app", ev.package, ev.class_name, ev.time)
+        elif kind in SESSION_CLOSE_EVENTS:
+            app_key = (ev.package, ev.instance_id if ev.instance_id is not None else ev.class_name)
+            s = open_apps.pop(app_key, None)
+            if s is not None:
+                s.end, s.closed_by = ev.time, kind
+                sessions.append(s)
+        elif kind in SCREEN_ON_EVENTS:
+            if screen is None:
+                screen = UsageSession("screen", None, None, ev.time)
+        elif kind in SCREEN_OFF_EVENTS or kind in DEVICE_DOWN_EVENTS:
+            close_apps(ev.time, kind)
+            if screen is not None:
+                screen.end, screen.closed_by = ev.time, kind
+                sessions.append(screen)
+                screen = None
+
+    if now is not None:
+        close_apps(now, "OPEN")
+        if screen is not None:
+            screen.end, screen.closed_by = now, "OPEN"
+            sessions.append(screen)
+    sessions.sort(key=lambda s: (s.start, s.end))
+    return sessions
+
+
+def summarize_usage_sessions(sessions):
+    """Per-package foreground totals plus overall screen-on time, largest first."""
+    apps = {}
+    screen = {"sessions": 0, "seconds": 0}
+    for s in sessions:
+        if s.kind == "screen":
+            screen["sessions"] += 1
+            screen["seconds"] += s.seconds
+            continue
+        a = apps.get(s.package)
+        if a is None:
+            a = apps[s.package] = {"package": s.package, "sessions": 0, "seconds": 0,
+                                   "first": s.start, "last": s.end, "longest": 0}
+        a["sessions"] += 1
+        a["seconds"] += s.seconds
+        a["first"] = min(a["first"], s.start)
+        a["last"] = max(a["last"], s.end)
+        a["longest"] = max(a["longest"], s.seconds)
+    return {
+        "screen": screen,
+        "packages": sorted(apps.values(), key=lambda a: a["seconds"], reverse=True),
+    }
+
+
+def format_duration(seconds):
+    seconds = int(seconds)
+    h, rem = divmod(seconds, 3600)
+    m, s = divmod(rem, 60)
+    return f"{h}:{m:02d}:{s:02d}" if h else f"{m}:{s:02d}"
+
+
+# `getprop` with no arguments dumps every property as "[key]: [value]".
+GETPROP_LINE_RE = re.compile(r'^\[([^\]]+)\]:\s*\[(.*)$')
+
+# Summary fields shown under "Connected Device" and in evidence device_info.
+DEVICE_INFO_PROPS = {
+    "Model": "ro.product.model",
+    "Manufacturer": "ro.product.manufacturer",
+    "Android Version": "ro.build.version.release",
+    "Device Name": "ro.product.device",
+    "Serial Number": "ro.serialno",
+    "CPU ABI": "ro.product.cpu.abi",
+}
+
+_device_props_cache = {}
+_device_props_lock = threading.Lock()
+
+
+def parse_getprop(output):
+    """Parses a full `getprop` dump into {key: value}; values may span lines."""
+    props = {}
+    key, value_lines = None, []
+    for line in output.splitlines():
+        if key is None:
+            m = GETPROP_LINE_RE.match(line.strip())
+            if not m:
+                continue
+            key, rest = m.group(1), m.group(2)
+        else:
+            rest = line
+        if rest.rstrip().endswith("]"):
+            value_lines.append(rest.rstrip()[:-1])
+            props[key] = "\n".join(value_lines)
+            key, value_lines = None, []
+        else:
+            value_lines.append(rest)
+    return props
+
+
+def probe_device_properties(device, refresh=False):
+    """
+    Fetches every system property with a single `getprop` round-trip and
+    caches the map per serial for the rest of the session.
+    """
+    with _device_props_lock:
+        if not refresh and device.serial in _device_props_cache:
+            return _device_props_cache[device.serial]
+    props = parse_getprop(device.shell("getprop"))
+    with _device_props_lock:
+        _device_props_cache[device.serial] = props
+    return props
+
+
+def device_info_summary(props):
+    return {label: props.get(key, "").strip() for label, key in DEVICE_INFO_PROPS.items()}
+
+
+# ============================================================
+# Streaming shell & content-provider parsing
+# ============================================================
+
+SHELL_READ_CHUNK = 64 * 1024
+
+CONTENT_ROW_RE = re.compile(r'^Row: \d+ (.*)$')
+CONTENT_FIELD_RE = re.compile(r'(?:^|, )([A-Za-z_][A-Za-z0-9_]*)=')
+
+
+def iter_shell_records(device, cmd, sep="\n", chunk_size=SHELL_READ_CHUNK):
+    """
+    Runs `cmd` over an ADB shell socket and yields decoded `sep`-terminated
+    records as they arrive, without ever holding the whole output in memory.
+    """
+    conn = device.create_connection()
+    try:
+        conn.send(f"shell:{cmd}")
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        pending = ""
+        while True:
+            chunk = conn.read(chunk_size)
+            if not chunk:
+                break
+            pending += decoder.decode(chunk)
+            if sep not in pending:
+                continue
+            records = pending.split(sep)
+            pending = records.pop()
+            yield from records
+        pending += decoder.decode(b"", final=True)
+        if pending:
+            yield pending
+    finally:
+        conn.close()
+
+
+class ConnectionReader:
+    """Minimal read-only file object over an ADB stream socket."""
+    def __init__(self, conn):
+        self.conn = conn
+
+    def read(self, size=-1):
+        if size is None or size < 0:
+            chunks = []
+            while True:
+                chunk = self.conn.read(SHELL_READ_CHUNK)
+                if not chunk:
+                    return b"".join(chunks)
+                chunks.append(chunk)
+        return self.conn.read(size)
+
+
+@contextmanager
+def open_exec_stream(device, cmd):
+    """
+    Raw stdout of `cmd` through adbd's exec: service (what `adb exec-out`
+    uses): no pty, so binary output such as a tar stream arrives unmangled.
+    """
+    conn = device.create_connection()
+    try:
+        conn.send(f"exec:{cmd}")
+        yield ConnectionReader(conn)
+    finally:
+        conn.close()
+
+
+def iter_shell_lines(device, cmd, chunk_size=SHELL_READ_CHUNK):
+    for line in iter_shell_records(device, cmd, "\n", chunk_size):
+        yield line.rstrip("\r")
+
+
+def _parse_content_fields(text):
+    matches = list(CONTENT_FIELD_RE.finditer(text))
+    row = {}
+    for i, m in enumerate(matches):
+        end = matches[i + 1].start() if i + 1 < len(matches) else len(text)
+        row[m.group(1)] = text[m.end():end]
+    return row
+
+
+def parse_content_row(text, columns=None):
+    """
+    Splits the body of one `Row: N k=v, k=v` record. When the column order is
+    known, each value runs up to the next expected ", column=" separator, so
+    commas and "key=" fragments inside values (SMS bodies) are kept intact.
+    """
+    if not columns or not text.startswith(f"{columns[0]}="):
+        return _parse_content_fields(text)
+    row = {}
+    pos = len(columns[0]) + 1
+    for i, col in enumerate(columns):
+        if i + 1 == len(columns):
+            row[col] = text[pos:]
+            break
+        sep = f", {columns[i + 1]}="
+        nxt = text.find(sep, pos)
+        if nxt < 0:
+            return _parse_content_fields(text)
+        row[col] = text[pos:nxt]
+        pos = nxt + len(sep)
+    return row
+
+
+def iter_content_rows(lines, columns=None):
+    """
+    Incrementally parses `content query` output into dicts. Lines that do not
+    start a new `Row:` belong to a value with embedded newlines. Without an
+    explicit column list the order is learned from the first row, since every
+    row of one cursor shares the same columns.
+    """
+    columns = list(columns) if columns else None
+    parts = None
+    for line in lines:
+        m = CONTENT_ROW_RE.match(line)
+        if m:
+            if parts is not None:
+                row = parse_content_row("\n".join(parts), columns)
+                columns = columns or list(row)
+                yield row
+            parts = [m.group(1)]
+        elif parts is not None:
+            parts.append(line)
+    if parts is not None:
+        yield parse_content_row("\n".join(parts), columns)
+
+
+# Provider URIs and the column used for date-range selection.
+CONTENT_PROVIDERS = {
+    "calls": {"uri": "content://call_log/calls", "date_column": "date"},
+    "sms": {"uri": "content://sms/", "date_column": "date"},
+    "contacts": {"uri": "content://contacts/phones/", "date_column": None},
+}
+
+
+def content_query_command(uri, projection=None, where=None, sort=None):
+    """
+    Builds a `content query` command line. Projection, selection and sort are
+    evaluated by the provider on the device, so only the requested columns
+    and rows are written to the shell stream.
+    """
+    parts = ["content", "query", "--uri", uri]
+    if projection:
+        parts += ["--projection", ":".join(projection)]
+    if where:
+        parts += ["--where", where]
+    if sort:
+        parts += ["--sort", sort]
+    return " ".join(shlex.quote(p) for p in parts)
+
+
+def date_range_where(column, start_ms=None, end_ms=None):
+    clauses = []
+    if start_ms is not None:
+        clauses.append(f"{column}>={int(start_ms)}")
+    if end_ms is not None:
+        clauses.append(f"{column}<{int(end_ms)}")
+    return " AND ".join(clauses) or None
+
+
+def provider_query_command(name, projection=None, where=None, sort=None, since_ms=None):
+    provider = CONTENT_PROVIDERS[name]
+    if since_ms is not None and provider["date_column"]:
+        window = date_range_where(provider["date_column"], start_ms=since_ms)
+        where = f"({where}) AND {window}" if where else window
+    return content_query_command(provider["uri"], projection=projection, where=where, sort=sort)
+
+
+# Rows per `content query` window; bounds peak memory during paged acquisition.
+DEFAULT_PROVIDER_PAGE_SIZE = 2000
+
+
+def iter_provider_pages(pool, name, columns, page_size=DEFAULT_PROVIDER_PAGE_SIZE, since_ms=None, after_id=None):
+    """
+    Pulls a provider in `_id`-ordered windows of `page_size` rows using
+    `_id > last` selection and a LIMIT appended to the sort clause, yielding
+    one list of rows per window. Providers that reject LIMIT in the sort
+    clause (an empty first page without content's "No result found." line)
+    fall back to a single streamed query, still batched by page_size.
+    """
+    if "_id" not in columns:
+        columns = ["_id"] + list(columns)
+    last_id = after_id
+    first = True
+    while True:
+        where = f"_id>{int(last_id)}" if last_id is not None else None
+        cmd = provider_query_command(name, projection=columns, where=where,
+                                     sort=f"_id ASC LIMIT {int(page_size)}", since_ms=since_ms)
+        status = []
+        page = list(iter_content_rows(_note_no_result(pool.shell_lines(cmd), status), columns))
+        if not page:
+            if first and not status:
+                yield from _iter_unpaged_provider(pool, name, columns, page_size, since_ms, after_id)
+            return
+        first = False
+        yield page
+        if len(page) < page_size:
+            return
+        try:
+            last_id = int(page[-1]["_id"])
+        except (KeyError, ValueError):
+            return
+
+
+# What `content query` prints for a valid query that matched no rows.
+CONTENT_NO_RESULT = "No result found."
+
+
+def _note_no_result(lines, status):
+    """Passes lines through, appending to `status` when the query reported an empty result."""
+    for line in lines:
+        if line.strip() == CONTENT_NO_RESULT:
+            status.append(True)
+        yield line
+
+
+def _iter_unpaged_provider(pool, name, columns, page_size, since_ms, after_id):
+    where = f"_id>{int(after_id)}" if after_id is not None else None
+    cmd = provider_query_command(name, projection=columns, where=where, sort="_id ASC", since_ms=since_ms)
+    page = []
+    for row in iter_content_rows(pool.shell_lines(cmd), columns):
+        page.append(row)
+        if len(page) >= page_size:
+            yield page
+            page = []
+    if page:
+        yield page
+
+
+class EvidenceSpool:
+    """
+    Append-only JSON-lines file holding one artifact's rows on disk, so large
+    providers never need to be held in memory as a whole.
+    """
+    def __init__(self, path, truncate=False):
+        self.path = path
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        if truncate or not os.path.exists(path):
+            open(path, "w", encoding="utf-8").close()
+        self.count = sum(1 for _ in self.iter_json_lines())
+
+    def __len__(self):
+        return self.count
+
+    def append(self, rows):
+        with open(self.path, "a", encoding="utf-8") as f:
+            for row in rows:
+                f.write(json.dumps(row, ensure_ascii=False) + "\n")
+                self.count += 1
+
+    def iter_json_lines(self):
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    yield line
+
+    def __iter__(self):
+        for line in self.iter_json_lines():
+            yield json.loads(line)
+
+
+class HighWaterMarks:
+    """
+    Per-serial acquisition marks (max provider _id, last usage-event time)
+    persisted next to the case spools, so re-acquisition only pulls newer rows.
+    Every write re-reads the file and replaces just its own artifact's mark,
+    under a lock shared by all instances on the same file: a detached
+    acquisition still winding down never rolls back its successor's marks.
+    """
+    _file_locks = {}
+    _file_locks_guard = threading.Lock()
+
+    def __init__(self, path):
+        self.path = path
+        with self._file_locks_guard:
+            self._lock = self._file_locks.setdefault(os.path.abspath(path), threading.Lock())
+        with self._lock:
+            self.marks = self._read()
+
+    def get(self, artifact):
+        with self._lock:
+            return self.marks.get(artifact)
+
+    def update(self, artifact, mark):
+        with self._lock:
+            self.marks = self._read()
+            self.marks[artifact] = {**mark, "updated": datetime.now().isoformat(timespec="seconds")}
+            self._save()
+
+    def clear(self, artifact):
+        with self._lock:
+            self.marks = self._read()
+            if self.marks.pop(artifact, None) is not None:
+                self._save()
+
+    def _read(self):
+        try:
+            if os.path.exists(self.path):
+                with open(self.path, "r", encoding="utf-8") as f:
+                    return json.load(f)
+        except Exception:
+            pass
+        return {}
+
+    def _save(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.marks, f, indent=2)
+        os.replace(tmp, self.path)
+
+
+# Parsed artifacts older than this are re-acquired on the next read.
+DEFAULT_ARTIFACT_TTL = 15 * 60
+
+
+class ArtifactCache:
+    """
+    Per-session cache of parsed artifacts keyed by (device serial, artifact).
+    Every consumer (acquisition, tabs, export, report) reads through it, so
+    an artifact is dumped and parsed once until it expires or is refreshed.
+    Concurrent readers of the same key wait for a single load.
+    """
+    def __init__(self, ttl=DEFAULT_ARTIFACT_TTL):
+        self.ttl = ttl
+        self._entries = {}
+        self._key_locks = {}
+        self._lock = threading.Lock()
+
+    def _key_lock(self, key):
+        with self._lock:
+            return self._key_locks.setdefault(key, threading.Lock())
+
+    def get(self, serial, artifact, loader=None, refresh=False, ttl=None):
+        """Returns the cached value, loading it with `loader()` when missing, stale or refreshed."""
+        key = (serial, artifact)
+        ttl = self.ttl if ttl is None else ttl
+        with self._key_lock(key):
+            entry = self._entries.get(key)
+            if entry and not refresh and time.monotonic() - entry[0] < ttl:
+                return entry[1]
+            if loader is None:
+                return None
+            value = loader()
+            self._entries[key] = (time.monotonic(), value)
+            return value
+
+    def put(self, serial, artifact, value):
+        with self._key_lock((serial, artifact)):
+            self._entries[(serial, artifact)] = (time.monotonic(), value)
+
+    def invalidate(self, serial=None, artifact=None):
+        with self._lock:
+            for key in list(self._entries):
+                if (serial is None or key[0] == serial) and (artifact is None or key[1] == artifact):
+                    del self._entries[key]
+
+
+def write_evidence_json(path, evidence):
+    """
+    Writes evidence.json like json.dump(indent=2), except that EvidenceSpool
+    values are streamed line by line into their JSON arrays.
+    """
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("{")
+        for i, (key, value) in enumerate(evidence.items()):
+            f.write("," if i else "")
+            f.write(f"\n  {json.dumps(key)}: ")
+            if isinstance(value, EvidenceSpool):
+                f.write("[")
+                for j, line in enumerate(value.iter_json_lines()):
+                    f.write(("," if j else "") + "\n    " + line)
+                f.write("\n  ]" if len(value) else "]")
+            else:
+                f.write(json.dumps(value, indent=2).replace("\n", "\n  "))
+        f.write("\n}\n")
+
+
+# ============================================================
+# Device file discovery
+# ============================================================
+
+# One record per regular file: "size mtime inode path". The path comes last so
+# spaces in names survive; -printf records are NUL-terminated so even newlines do.
+FIND_PRINTF_CMD = "find {roots} -type f -printf '%s %T@ %i %p\\0' 2>/dev/null"
+# toybox builds without -printf: newline-terminated stat output instead.
+FIND_STAT_CMD = "find {roots} -type f -exec stat -c '%s %Y %i %n' {{}} + 2>/dev/null"
+FIND_PRINTF_PROBE = "find / -maxdepth 0 -printf '%i\\0' 2>/dev/null"
+
+_find_printf_support = {}
+
+
+class DeviceFile:
+    """One regular file on the device as reported by `find`: size in bytes, mtime in epoch seconds."""
+    __slots__ = ("path", "size", "mtime", "inode")
+
+    def __init__(self, path, size, mtime, inode):
+        self.path = path
+        self.size = size
+        self.mtime = mtime
+        self.inode = inode
+
+    @classmethod
+    def from_record(cls, record):
+        parts = record.split(" ", 3)
+        if len(parts) != 4 or not parts[3].startswith("/"):
+            return None
+        try:
+            return cls(parts[3], int(parts[0]), int(float(parts[1])), int(parts[2]))
+        except ValueError:
+            return None
+
+    @property
+    def name(self):
+        return self.path.rsplit("/", 1)[-1]
+
+    def to_dict(self):
+        return {"path": self.path, "size": self.size, "mtime": self.mtime, "inode": self.inode}
+
+
+def find_supports_printf(pool):
+    serial = pool.serial
+    if serial not in _find_printf_support:
+        out = pool.shell(FIND_PRINTF_PROBE) or ""
+        _find_printf_support[serial] = out.rstrip("\0").strip().isdigit()
+    return _find_printf_support[serial]
+
+
+def iter_device_files(pool, roots=("/sdcard",)):
+    """
+    Streams every regular file under `roots` as DeviceFile records, using
+    `find -printf` when the device's find supports it and `find -exec stat`
+    otherwise. Missing roots are skipped silently.
+    """
+    quoted = " ".join(shlex.quote(r.rstrip("/") + "/") for r in roots)
+    if find_supports_printf(pool):
+        records = pool.shell_records(FIND_PRINTF_CMD.format(roots=quoted), "\0")
+    else:
+        records = (line.rstrip("\r") for line in pool.shell_records(FIND_STAT_CMD.format(roots=quoted), "\n"))
+    for record in records:
+        f = DeviceFile.from_record(record)
+        if f is not None:
+            yield f
+
+
+def suffix_lookup(ext_map):
+    """Inverts {category: {".ext", ...}} into {".ext": category}."""
+    return {ext.lower(): category for category, exts in ext_map.items() for ext in exts}
+
+
+def file_suffix(name):
+    dot = name.rfind(".")
+    return name[dot:].lower() if dot > 0 else ""
+
+
+# How long one /sdcard walk is reused before a section open lists the device again.
+FILE_MANIFEST_TTL = 5 * 60
+
+
+class FileManifest:
+    """
+    Every regular file found under /sdcard in one walk. The full listing is
+    written to a JSON-lines manifest on disk; only files whose suffix falls in
+    one of the `ext_map` categories are kept in memory, grouped by category
+    in discovery order.
+    """
+    def __init__(self, path, ext_map):
+        self.path = path
+        self.suffixes = suffix_lookup(ext_map)
+        self.by_category = {category: [] for category in ext_map}
+        self.classified = []  # (category, DeviceFile) in discovery order
+        self.total = 0
+        self.total_bytes = 0
+
+    def build(self, pool, roots=("/sdcard",), task=None):
+        spool = EvidenceSpool(self.path, truncate=True)
+        batch = []
+        for f in iter_device_files(pool, roots):
+            self.total += 1
+            self.total_bytes += f.size
+            batch.append(f.to_dict())
+            if len(batch) >= DEFAULT_PROVIDER_PAGE_SIZE:
+                spool.append(batch)
+                batch = []
+                if task:
+                    task.check_cancelled()
+                    task.report("files", f"{self.total} files scanned...")
+            category = self.suffixes.get(file_suffix(f.name))
+            if category is not None:
+                self.by_category[category].append(f)
+                self.classified.append((category, f))
+        spool.append(batch)
+        return self
+
+    def files(self, category):
+        return self.by_category.get(category, [])
+
+    def __len__(self):
+        return self.total
+
+
+class EvidenceStore:
+    """
+    Content-addressed copy of pulled device files: each distinct content is
+    stored once as blobs/<sha256[:2]>/<sha256>, and manifest.json maps every
+    device path to the hash, size and mtime it was pulled with.
+    """
+    def __init__(self, root):
+        self.root = root
+        self.manifest_path = os.path.join(root, "manifest.json")
+        self._lock = threading.Lock()
+        self.entries = {}
+        os.makedirs(os.path.join(root, "tmp"), exist_ok=True)
+        try:
+            if os.path.exists(self.manifest_path):
+                with open(self.manifest_path, "r", encoding="utf-8") as f:
+                    self.entries = json.load(f)
+        except Exception:
+            self.entries = {}
+
+    def blob_path(self, digest):
+        return os.path.join(self.root, "blobs", digest[:2], digest)
+
+    def get(self, device_path):
+        with self._lock:
+            return self.entries.get(device_path)
+
+    def path_for(self, device_path):
+        """Local blob for `device_path`, or None when it has not been pulled (or the blob is gone)."""
+        entry = self.get(device_path)
+        if entry is None:
+            return None
+        path = self.blob_path(entry["sha256"])
+        return path if os.path.exists(path) else None
+
+    def is_current(self, device_path, size, mtime):
+        """True when `device_path` is stored with the same size and mtime the device reports now."""
+        entry = self.get(device_path)
+        return (entry is not None and entry["size"] == size and entry.get("mtime") == mtime
+                and os.path.exists(self.blob_path(entry["sha256"])))
+
+    def temp_path(self):
+        return os.path.join(self.root, "tmp", f"{threading.get_ident()}-{time.monotonic_ns()}")
+
+    def ingest_file(self, device_path, tmp_path, mtime=None):
+        """Moves a freshly pulled file into the store; returns its blob path."""
+        digest = hashlib.sha256()
+        with open(tmp_path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(chunk)
+        return self._commit(device_path, tmp_path, digest.hexdigest(), os.path.getsize(tmp_path), mtime)
+
+    def ingest_stream(self, device_path, stream, mtime=None):
+        """Copies a readable stream into the store, hashing on the way; returns its blob path."""
+        tmp_path = self.temp_path()
+        digest, size = hashlib.sha256(), 0
+        try:
+            with open(tmp_path, "wb") as out:
+                for chunk in iter(lambda: stream.read(1024 * 1024), b""):
+                    digest.update(chunk)
+                    out.write(chunk)
+                    size += len(chunk)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        return self._commit(device_path, tmp_path, digest.hexdigest(), size, mtime)
+
+    def _commit(self, device_path, tmp_path, digest, size, mtime):
+        blob = self.blob_path(digest)
+        with self._lock:
+            if os.path.exists(blob):
+                os.remove(tmp_path)  # same content already stored
+            else:
+                os.makedirs(os.path.dirname(blob), exist_ok=True)
+                os.replace(tmp_path, blob)
+            # A changed file gets a new entry; the previous version's blob stays in the store.
+            self.entries[device_path] = {"sha256": digest, "size": size, "mtime": mtime}
+        return blob
+
+    def save(self):
+        with self._lock:
+            tmp = self.manifest_path + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(self.entries, f, indent=1)
+            os.replace(tmp, self.manifest_path)
+
+
 # ============================================================
 # PreviewWidget: unified preview area used in central tabs
 # ============================================================
@@ -67,9 +1335,10 @@ class PreviewWidget(QWidget):
     Supports: image (jpg/png), text, pdf, docx, media (audio/video),
     and archives (zip, tar/tgz) with internal browser & sub-preview.
     """
-    def __init__(self, path, temp_dir=None, parent=None):
+    def __init__(self, path, temp_dir=None, parent=None, name=None):
         super().__init__(parent)
         self.path = path
+        self.name = name or os.path.basename(path)
         self.temp_dir = temp_dir or os.path.join(os.getcwd(), "TempData")
         os.makedirs(self.temp_dir, exist_ok=True)
 
@@ -113,7 +1382,7 @@ class PreviewWidget(QWidget):
     # ---------- rendering ----------
 
     def _render(self, path):
-        ext = os.path.splitext(path)[1].lower()
+        ext = os.path.splitext(self.name)[1].lower()
         if ext in [".jpg", ".jpeg", ".png", ".bmp", ".gif", ".webp"]:
             self._show_image(path)
         elif ext in [".mp3", ".wav", ".m4a", ".aac", ".flac", ".ogg", ".mp4", ".avi", ".mkv", ".mov", ".wmv"]:
@@ -270,7 +1539,8 @@ class PreviewWidget(QWidget):
         self.root.addWidget(splitter)
 
         members = []
-        ext = os.path.splitext(path)[1].lower()
+        # Store blobs have no extension; the display name carries it.
+        ext = os.path.splitext(self.name)[1].lower()
 
         try:
             if ext == ".zip":
@@ -330,59 +1600,594 @@ class PreviewWidget(QWidget):
         layout.addWidget(widget)
 
 
+# ============================================================
+# Virtualized table models
+# ============================================================
+
+class ColumnStoreTableModel(QAbstractTableModel):
+    """
+    Read-only table model over one list of raw values per column.
+    Display strings are produced by per-column formatters only for the cells
+    the view actually paints; Qt.UserRole returns the raw value and SORT_ROLE
+    a typed key (float for `numeric_keys`, lowercase text otherwise).
+    """
+    SORT_ROLE = Qt.UserRole + 1
+
+    def __init__(self, headers, keys, formatters=None, numeric_keys=(), parent=None):
+        super().__init__(parent)
+        self.headers = list(headers)
+        self.keys = list(keys)
+        self.formatters = formatters or {}
+        self.numeric_keys = set(numeric_keys)
+        self.columns = [[] for _ in self.keys]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else (len(self.columns[0]) if self.columns else 0)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.keys)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        raw = self.columns[index.column()][index.row()]
+        if role == Qt.DisplayRole:
+            fmt = self.formatters.get(self.keys[index.column()])
+            return fmt(raw) if fmt else raw
+        if role == Qt.UserRole:
+            return raw
+        if role == self.SORT_ROLE:
+            if self.keys[index.column()] in self.numeric_keys:
+                try:
+                    return float(raw)
+                except (TypeError, ValueError):
+                    return float("-inf")
+            return (raw or "").lower()
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.headers[section]
+        return super().headerData(section, orientation, role)
+
+    def append_rows(self, rows):
+        rows = list(rows)
+        if not rows:
+            return
+        first = self.rowCount()
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        for col, key in zip(self.columns, self.keys):
+            col.extend(row.get(key, "") for row in rows)
+        self.endInsertRows()
+
+    def clear(self):
+        self.beginResetModel()
+        self.columns = [[] for _ in self.keys]
+        self.endResetModel()
+
+
+def resize_columns_from_sample(view, sample_rows=200, max_width=480):
+    """
+    Sizes columns from the header plus the first `sample_rows` rows instead of
+    resizeColumnsToContents(), which measures every cell of the model.
+    """
+    model = view.model()
+    metrics = view.fontMetrics()
+    rows = min(model.rowCount(), sample_rows)
+    for col in range(model.columnCount()):
+        width = metrics.horizontalAdvance(str(model.headerData(col, Qt.Horizontal) or ""))
+        for row in range(rows):
+            text = str(model.data(model.index(row, col)) or "").split("\n", 1)[0]
+            width = max(width, metrics.horizontalAdvance(text))
+        view.setColumnWidth(col, min(width + 24, max_width))
+
+
+def make_table_view(model):
+    view = QTableView()
+    view.setModel(model)
+    view.setWordWrap(False)
+    view.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+    view.verticalHeader().setDefaultSectionSize(view.fontMetrics().height() + 6)
+    return view
+
+
+class ProviderTableWidget(QWidget):
+    """
+    Filterable, sortable table over a ColumnStoreTableModel, used for the
+    Call Logs, SMS and Contacts tabs.
+    """
+    def __init__(self, model, parent=None):
+        super().__init__(parent)
+        self.model = model
+        self.loading = False
+        self.loader = None
+
+        self.proxy = QSortFilterProxyModel()
+        self.proxy.setSourceModel(model)
+        self.proxy.setSortRole(ColumnStoreTableModel.SORT_ROLE)
+        self.proxy.setFilterKeyColumn(-1)
+        self.proxy.setFilterCaseSensitivity(Qt.CaseInsensitive)
+
+        self.table = make_table_view(self.proxy)
+        self.table.setSortingEnabled(True)
+        self.table.sortByColumn(-1, Qt.AscendingOrder)
+
+        self.search_bar = QLineEdit()
+        self.search_bar.setPlaceholderText("Filter rows...")
+        # Debounced: every column is rescanned per filter, so wait for typing to pause.
+        self.filter_timer = QTimer(self)
+        self.filter_timer.setSingleShot(True)
+        self.filter_timer.setInterval(200)
+        self.filter_timer.timeout.connect(lambda: self.proxy.setFilterFixedString(self.search_bar.text()))
+        self.search_bar.textChanged.connect(self.filter_timer.start)
+
+        self.count_label = QLabel()
+        self.proxy.rowsInserted.connect(self._update_count)
+        self.proxy.rowsRemoved.connect(self._update_count)
+        self.proxy.modelReset.connect(self._update_count)
+        self.proxy.layoutChanged.connect(self._update_count)
+
+        top = QHBoxLayout()
+        top.addWidget(QLabel("Filter:"))
+        top.addWidget(self.search_bar, 1)
+        top.addWidget(self.count_label)
+
+        layout = QVBoxLayout(self)
+        layout.addLayout(top)
+        layout.addWidget(self.table)
+        self._update_count()
+
+    def set_loading(self, loading):
+        self.loading = loading
+        self._update_count()
+
+    def _update_count(self, *args):
+        if self.loading:
+            self.count_label.setText("Loading...")
+            return
+        self.count_label.setText(f"{self.proxy.rowCount()} / {self.model.rowCount()} rows")
+
+
 # ============================================================
 # Usage Stats UI
 # ============================================================
 
+class UsageEventsModel(QAbstractTableModel):
+    """
+    Usage events stored as compact columns: epoch seconds, instance ids and
+    flags in int64 arrays (-1 = absent); event types, packages, classes and
+    task roots interned into small tables referenced by id arrays; leftover
+    extra-info strings in a plain list. data() formats a cell only when the
+    view or the filter proxy asks for it. A model loaded from a
+    UsageDumpIndex (set_dump_index) holds only the time, event and package
+    columns; a row's extra fields are parsed from its dump line on demand.
+    """
+    HEADERS = ["Time", "Event Type", "Package", "Extra Info"]
+    SORT_ROLE = Qt.UserRole + 1
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._reset_columns()
+
+    def _reset_columns(self):
+        self.times = array("q")
+        self.event_ids = array("H")
+        self.package_ids = array("I")
+        self.class_ids = array("I")
+        self.task_root_ids = array("I")
+        self.instance_ids = array("q")
+        self.flags = array("q")
+        self.extras = []
+        self.event_types, self._event_index = [], {}
+        self.packages, self._package_index = [], {}
+        self.names, self._name_index = [None], {None: 0}  # classes and task roots; 0 = absent
+        self._filter_index = None
+        self.row_index = None
+
+    def filter_index(self):
+        if self._filter_index is None:
+            self._filter_index = UsageFilterIndex(self, self.row_index)
+        return self._filter_index
+
+    @staticmethod
+    def _intern(value, table, index):
+        idx = index.get(value)
+        if idx is None:
+            idx = index[value] = len(table)
+            table.append(value)
+        return idx
+
+    def set_events(self, events):
+        """Loads UsageEvent records; only their column values are kept."""
+        self.beginResetModel()
+        self._reset_columns()
+        for ev in events:
+            self.times.append(ev.time)
+            self.event_ids.append(self._intern(ev.event_type, self.event_types, self._event_index))
+            self.package_ids.append(self._intern(ev.package, self.packages, self._package_index))
+            self.class_ids.append(self._intern(ev.class_name, self.names, self._name_index))
+            self.task_root_ids.append(self._intern(ev.task_root_package, self.names, self._name_index))
+            self.instance_ids.append(-1 if ev.instance_id is None else ev.instance_id)
+            self.flags.append(-1 if ev.flags is None else ev.flags)
+            self.extras.append(ev.extra_info)
+        self.endResetModel()
+
+    def set_dump_index(self, index):
+        """
+        Loads the rows of a UsageDumpIndex (kept open by the caller): the
+        time, event and package columns are copies of its arrays, so nothing
+        is parsed until a row's extra fields are needed.
+        """
+        self.beginResetModel()
+        self._reset_columns()
+        self.row_index = index
+        self.times = array("q", index.times)
+        self.event_ids = array("H", index.type_ids)
+        self.package_ids = array("I", index.package_ids)
+        self.event_types = list(index.event_types)
+        self._event_index = {name: i for i, name in enumerate(self.event_types)}
+        self.packages = list(index.packages)
+        self._package_index = {name: i for i, name in enumerate(self.packages)}
+        self.endResetModel()
+
+    def event_at(self, row):
+        if self.row_index is not None:
+            return self.row_index.event_at(row)
+        return UsageEvent(
+            self.times[row], self.event_types[self.event_ids[row]], self.packages[self.package_ids[row]],
+            class_name=self.names[self.class_ids[row]],
+            instance_id=None if self.instance_ids[row] < 0 else self.instance_ids[row],
+            task_root_package=self.names[self.task_root_ids[row]],
+            flags=None if self.flags[row] < 0 else self.flags[row],
+            extra_info=self.extras[row],
+        )
+
+    def extra_text(self, row):
+        return self.event_at(row).extra_text()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.times)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def time_text(self, row):
+        if self.times[row] < 0:
+            return ""
+        return datetime.fromtimestamp(self.times[row]).strftime("%Y-%m-%d %H:%M:%S")
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row, col = index.row(), index.column()
+        if role == self.SORT_ROLE and col == 0:
+            return self.times[row]
+        if role not in (Qt.DisplayRole, self.SORT_ROLE):
+            return None
+        if col == 0:
+            return self.time_text(row)
+        if col == 1:
+            return self.event_types[self.event_ids[row]]
+        if col == 2:
+            return self.packages[self.package_ids[row]]
+        return self.extra_text(row)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+
+def _trigrams(text):
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+# ---------- usage filter language ----------
+#
+#   term   := [!]key op value        key: time | event | package | extra
+#   op     := =  substring   == exact   != not substring   ~ regex
+#             > >= < <=      (time only; value is a date/time prefix)
+#   query  := term term ... [OR term term ...]   terms AND-ed, groups OR-ed
+#
+# Values may be quoted: time>="2025-08-01 10:00". For time, `=` with a date
+# prefix (time=2025-08) selects the whole period.
+
+USAGE_FILTER_TERM_RE = re.compile(r'^(!?)(time|event|package|extra)(>=|<=|==|!=|=|~|>|<)(.*)$', re.IGNORECASE)
+
+USAGE_TIME_FORMATS = [
+    ("%Y-%m-%d %H:%M:%S", "seconds"),
+    ("%Y-%m-%d %H:%M", "minutes"),
+    ("%Y-%m-%d %H", "hours"),
+    ("%Y-%m-%d", "days"),
+    ("%Y-%m", "month"),
+    ("%Y", "year"),
+]
+
+
+def parse_time_period(value):
+    """Returns the [start, end) epoch range covered by a date/time prefix, or None."""
+    value = value.strip().replace("T", " ")
+    for fmt, unit in USAGE_TIME_FORMATS:
+        try:
+            start = datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+        if unit == "year":
+            end = start.replace(year=start.year + 1)
+        elif unit == "month":
+            end = start.replace(year=start.year + start.month // 12, month=start.month % 12 + 1)
+        else:
+            end = start + timedelta(**{unit: 1})
+        return int(start.timestamp()), int(end.timestamp())
+    return None
+
+
+class UsageFilterTerm:
+    __slots__ = ("key", "op", "value", "negate", "period", "regex")
+
+    def __init__(self, key, op, value, negate=False):
+        self.key = key
+        self.op = op
+        self.value = value.lower()
+        self.negate = negate
+        self.period = parse_time_period(value) if key == "time" else None
+        self.regex = re.compile(value, re.IGNORECASE) if op == "~" else None
+
+
+def compile_usage_filter(text):
+    """
+    Compiles a filter string into (groups, errors): groups is a list of
+    AND-ed term lists that are OR-ed together; invalid terms are reported
+    in errors and left out.
+    """
+    try:
+        tokens = shlex.split(text)
+    except ValueError as e:
+        return [], [str(e)]
+    groups, current, errors = [], [], []
+    for token in tokens:
+        if token.upper() == "OR" or token == "|":
+            if current:
+                groups.append(current)
+                current = []
+            continue
+        m = USAGE_FILTER_TERM_RE.match(token)
+        if not m:
+            errors.append(f"Unrecognised term: {token}")
+            continue
+        negate, key, op, value = m.group(1) == "!", m.group(2).lower(), m.group(3), m.group(4)
+        if op == "!=":
+            negate, op = not negate, "="
+        try:
+            term = UsageFilterTerm(key, op, value, negate)
+        except re.error as e:
+            errors.append(f"Bad regex in {token}: {e}")
+            continue
+        if op in (">", ">=", "<", "<=") and term.period is None:
+            errors.append(f"{token}: ordering needs time=<date>, e.g. time>=2025-08-01")
+            continue
+        current.append(term)
+    if current:
+        groups.append(current)
+    return groups, errors
+
+
+class LazyTextColumn:
+    """Lowercased per-row text, computed the first time a filter reads a row."""
+    __slots__ = ("_values", "_compute")
+
+    def __init__(self, size, compute):
+        self._values = [None] * size
+        self._compute = compute
+
+    def __getitem__(self, row):
+        value = self._values[row]
+        if value is None:
+            value = self._values[row] = self._compute(row).lower()
+        return value
+
+
+class UsageFilterIndex:
+    """
+    Precomputed lookup structures for filtering a UsageEventsModel:
+    lowercase time and extra columns filled per row on first use (a dump
+    row's line is only parsed once a filter reaches it), inverted row lists per
+    interned package / event type, trigram indexes over the distinct
+    package and event names, and the rows sorted by epoch so time ranges
+    resolve with two binary searches. Substring results are remembered per
+    column so extending a filter string only rescans the previous matches.
+    """
+    # Cheapest first: later terms only scan the rows earlier terms kept.
+    TERM_COST = {"package": 0, "event": 0, "time": 1, "extra": 2}
+
+    def __init__(self, model, row_index=None):
+        """`row_index`: a UsageDumpIndex whose rows are the model's rows (dump tabs)."""
+        self.model = model
+        self.row_count = model.rowCount()
+        if row_index is not None and len(row_index) != self.row_count:
+            row_index = None
+        self.row_index = row_index
+        self.time_lower = LazyTextColumn(self.row_count, model.time_text)
+        self.extra_lower = LazyTextColumn(self.row_count, model.extra_text)
+        if row_index is not None:
+            self.package_rows = [row_index.rows_for_package(p) for p in model.packages]
+        else:
+            self.package_rows = self._invert(model.package_ids, len(model.packages))
+            self.time_order = array("I", sorted(range(self.row_count), key=model.times.__getitem__))
+            self.sorted_times = array("q", (model.times[r] for r in self.time_order))
+        self.event_rows = self._invert(model.event_ids, len(model.event_types))
+        self.package_trigrams = self._trigram_index(model.packages)
+        self.event_trigrams = self._trigram_index(model.event_types)
+        self._last = {}  # key -> (value, rows) for unrestricted substring matches
+
+    @staticmethod
+    def _invert(ids, size):
+        rows = [array("I") for _ in range(size)]
+        for row, value_id in enumerate(ids):
+            rows[value_id].append(row)
+        return rows
+
+    @staticmethod
+    def _trigram_index(names):
+        index = {}
+        for value_id, name in enumerate(names):
+            for tri in _trigrams(name.lower()):
+                index.setdefault(tri, set()).add(value_id)
+        return index
+
+    def _interned(self, key):
+        if key == "package":
+            return self.model.packages, self.package_trigrams, self.package_rows
+        return self.model.event_types, self.event_trigrams, self.event_rows
+
+    def _column(self, key):
+        return self.time_lower if key == "time" else self.extra_lower
+
+    def _ids_containing(self, value, names, trigram_index):
+        tris = _trigrams(value)
+        candidates = set.intersection(*(trigram_index.get(t, set()) for t in tris)) if tris else range(len(names))
+        return [i for i in candidates if value in names[i].lower()]
+
+    def _rows_for_ids(self, ids, row_lists, candidates=None):
+        rows = set()
+        for i in ids:
+            rows.update(row_lists[i])
+        return rows if candidates is None else rows & candidates
+
+    def _time_range(self, start, end, candidates=None):
+        if self.row_index is not None:
+            rows = set(self.row_index.rows_between(start, end))
+        else:
+            lo = bisect_left(self.sorted_times, start)
+            hi = bisect_left(self.sorted_times, end)
+            rows = set(self.time_order[lo:hi])
+        return rows if candidates is None else rows & candidates
+
+    def _substring(self, key, value, candidates=None):
+        if key in ("package", "event"):
+            names, trigrams, row_lists = self._interned(key)
+            return self._rows_for_ids(self._ids_containing(value, names, trigrams), row_lists, candidates)
+        column = self._column(key)
+        if candidates is not None:
+            return {r for r in candidates if value in column[r]}
+        prev = self._last.get(key)
+        if prev and prev[0] == value:
+            return prev[1]
+        scan = prev[1] if prev and prev[0] in value else range(self.row_count)
+        rows = {r for r in scan if value in column[r]}
+        self._last[key] = (value, rows)
+        return rows
+
+    def _match(self, term, candidates=None):
+        key, op = term.key, term.op
+        if key == "time" and term.period and op != "~" and op != "==":
+            start, end = term.period
+            bounds = {"=": (start, end), ">=": (start, None), ">": (end, None), "<": (None, start), "<=": (None, end)}[op]
+            lo = bounds[0] if bounds[0] is not None else -(1 << 62)
+            hi = bounds[1] if bounds[1] is not None else (1 << 62)
+            return self._time_range(lo, hi, candidates)
+        if op == "=":
+            return self._substring(key, term.value, candidates)
+        if key in ("package", "event"):
+            names, _, row_lists = self._interned(key)
+            if op == "==":
+                ids = [i for i, n in enumerate(names) if n.lower() == term.value]
+            else:
+                ids = [i for i, n in enumerate(names) if term.regex.search(n)]
+            return self._rows_for_ids(ids, row_lists, candidates)
+        column = self._column(key)
+        scan = candidates if candidates is not None else range(self.row_count)
+        if op == "==":
+            return {r for r in scan if column[r] == term.value}
+        return {r for r in scan if term.regex.search(column[r])}
+
+    def _term_rows(self, term, candidates=None):
+        rows = self._match(term, candidates)
+        if term.negate:
+            universe = candidates if candidates is not None else set(range(self.row_count))
+            return universe - rows
+        return rows
+
+    def evaluate(self, groups):
+        """Rows matched by a compiled query; None means every row passes."""
+        if not groups:
+            return None
+        result = set()
+        for terms in groups:
+            rows = None
+            for term in sorted(terms, key=lambda t: (self.TERM_COST[t.key], t.negate)):
+                rows = self._term_rows(term, rows)
+                if not rows:
+                    break
+            result |= rows
+        return result
+
+
 class ParameterFilterProxyModel(QSortFilterProxyModel):
     def __init__(self):
         super().__init__()
-        self.filters = {}
+        self.filters = []
+        self.accepted_rows = None
 
-    def set_filters(self, filters):
-        self.filters = filters
+    def set_filters(self, groups):
+        """Applies a query compiled by compile_usage_filter()."""
+        self.filters = groups
+        model = self.sourceModel()
+        self.accepted_rows = model.filter_index().evaluate(groups) if groups else None
         self.invalidateFilter()
 
     def filterAcceptsRow(self, source_row, source_parent):
-        model = self.sourceModel()
-        columns = {"time": 0, "event": 1, "package": 2, "extra": 3}
-        for key, value in self.filters.items():
-            if key in columns:
-                idx = model.index(source_row, columns[key], source_parent)
-                text = (model.data(idx) or "").lower()
-                if value.lower() not in text:
-                    return False
-        return True
+        return self.accepted_rows is None or source_row in self.accepted_rows
 
 
 class UsageStatsWidget(QWidget):
-    def __init__(self, adb_device, temp_root):
+    def __init__(self, load_events, thread_pool):
+        """
+        load_events(refresh) returns the parsed usage events (see DroidForen.usage_events),
+        or, for a saved dump, its UsageDumpIndex: the tab then reads rows from
+        the index and the dump and closes it with cleanup(). It runs on
+        `thread_pool`; the table fills in when it returns.
+        """
         super().__init__()
-        self.device = adb_device
-        self.out_dir = os.path.join(temp_root, "UsageStats")
-        os.makedirs(self.out_dir, exist_ok=True)
-        self.local_file = os.path.join(self.out_dir, "usage_dump.txt")
+        self.load_events = load_events
+        self.thread_pool = thread_pool
+        self._loader = None
+        self._load_t0 = 0.0
 
-        self.model = QStandardItemModel()
-        self.model.setHorizontalHeaderLabels(["Time", "Event Type", "Package", "Extra Info"])
+        self.model = UsageEventsModel()
 
         self.proxy = ParameterFilterProxyModel()
         self.proxy.setSourceModel(self.model)
+        self.proxy.setSortRole(UsageEventsModel.SORT_ROLE)
 
-        self.table = QTableView()
-        self.table.setModel(self.proxy)
+        self.table = make_table_view(self.proxy)
         self.table.setSortingEnabled(True)
+        self.table.sortByColumn(-1, Qt.AscendingOrder)
 
         self.search_bar = QLineEdit()
-        self.search_bar.setPlaceholderText("Search filters: time=2025-08 package=com.android.chrome event=RESUMED extra=...")
-        self.search_bar.textChanged.connect(self.apply_filters)
+        self.search_bar.setPlaceholderText(
+            'Filters: time>=2025-08-01 time<"2025-08-02 12:00" package=chrome event==ACTIVITY_RESUMED '
+            '!extra~^class= OR package~^com.whatsapp'
+        )
+        # Debounced: the filter runs once typing pauses, not on every keystroke.
+        self.filter_timer = QTimer(self)
+        self.filter_timer.setSingleShot(True)
+        self.filter_timer.setInterval(200)
+        self.filter_timer.timeout.connect(lambda: self.apply_filters(self.search_bar.text()))
+        self.search_bar.textChanged.connect(self.filter_timer.start)
 
         self.refresh_btn = QPushButton("Refresh")
-        self.refresh_btn.clicked.connect(self.refresh_usage_stats)
+        self.refresh_btn.clicked.connect(lambda: self.refresh_usage_stats(refresh=True))
+
+        self.filter_error = QLabel()
+        self.filter_error.setStyleSheet("color: #c0392b;")
+        self.status_label = QLabel()
 
         top = QHBoxLayout()
         top.addWidget(QLabel("Filter:"))
         top.addWidget(self.search_bar, 1)
+        top.addWidget(self.filter_error)
+        top.addWidget(self.status_label)
         top.addWidget(self.refresh_btn)
 
         layout = QVBoxLayout(self)
@@ -391,38 +2196,482 @@ class UsageStatsWidget(QWidget):
 
         self.refresh_usage_stats()
 
-    def refresh_usage_stats(self):
-        try:
-            self.device.shell('sh -c "dumpsys usagestats > /sdcard/usage_dump.txt"')
-            self.device.pull("/sdcard/usage_dump.txt", self.local_file)
-            events = parse_usage_events(self.local_file)
-            self.populate_table(events)
-        except Exception as e:
-            self.model.removeRows(0, self.model.rowCount())
-            self.model.appendRow([
-                QStandardItem("ERROR"),
-                QStandardItem("PULL_FAILED"),
-                QStandardItem("adb/usagestats"),
-                QStandardItem(str(e))
-            ])
+    def refresh_usage_stats(self, refresh=False):
+        self.refresh_btn.setEnabled(False)
+        self.status_label.setText("Loading...")
+        self._load_t0 = time.perf_counter()
+        self._loader = LoadWorker(lambda: self.load_events(refresh))
+        self._loader.signals.finished.connect(self._on_loaded)
+        self._loader.signals.failed.connect(self._on_load_failed)
+        self.thread_pool.start(self._loader)
+
+    def _on_loaded(self, events):
+        self._loader = None
+        self.populate_table([] if events is None else events)
+        self.status_label.setText(f"{self.model.rowCount()} events ({time.perf_counter() - self._load_t0:.2f}s)")
+        self.refresh_btn.setEnabled(True)
+
+    def _on_load_failed(self, error):
+        self._loader = None
+        self.populate_table([UsageEvent(-1, "PULL_FAILED", "adb/usagestats", extra_info=f"ERROR: {error}")])
+        self.status_label.setText("")
+        self.refresh_btn.setEnabled(True)
 
     def populate_table(self, events):
-        self.model.removeRows(0, self.model.rowCount())
-        for ev in events:
-            self.model.appendRow([
-                QStandardItem(ev["time"]),
-                QStandardItem(ev["event_type"]),
-                QStandardItem(ev["package"]),
-                QStandardItem(ev["extra_info"])
-            ])
+        previous = self.model.row_index
+        if isinstance(events, UsageDumpIndex):
+            self.model.set_dump_index(events)
+        else:
+            self.model.set_events(events)
+        if previous is not None and previous is not self.model.row_index:
+            previous.close()
+        self.apply_filters(self.search_bar.text())
+        resize_columns_from_sample(self.table)
+
+    def cleanup(self):
+        """Closes the dump a saved-dump tab reads its rows from."""
+        if self.model.row_index is not None:
+            self.model.row_index.close()
 
     def apply_filters(self, text):
-        filters = {}
-        for part in text.split():
-            if "=" in part:
-                k, v = part.split("=", 1)
-                filters[k.strip().lower()] = v.strip()
-        self.proxy.set_filters(filters)
+        groups, errors = compile_usage_filter(text)
+        self.filter_error.setText("; ".join(errors))
+        self.proxy.set_filters(groups)
+
+
+class UsageSessionsWidget(QWidget):
+    """Per-package foreground totals above the individual reconstructed sessions."""
+    def __init__(self, load_sessions, thread_pool):
+        """
+        load_sessions(refresh) returns UsageSession records (see DroidForen.usage_sessions);
+        it runs on `thread_pool` and the tables fill in when it returns.
+        """
+        super().__init__()
+        self.load_sessions = load_sessions
+        self.thread_pool = thread_pool
+        self._loader = None
+
+        fmt_time = lambda v: datetime.fromtimestamp(v).strftime("%Y-%m-%d %H:%M:%S") if v is not None else ""
+        self.summary_model = ColumnStoreTableModel(
+            ["Package", "Sessions", "Foreground", "Longest", "First Seen", "Last Seen"],
+            ["package", "sessions", "seconds", "longest", "first", "last"],
+            formatters={"seconds": format_duration, "longest": format_duration, "first": fmt_time, "last": fmt_time},
+            numeric_keys={"sessions", "seconds", "longest", "first", "last"},
+        )
+        self.sessions_model = ColumnStoreTableModel(
+            ["Start", "End", "Duration", "Kind", "Package", "Activity", "Closed By"],
+            ["start", "end", "seconds", "kind", "package", "class_name", "closed_by"],
+            formatters={"start": fmt_time, "end": fmt_time, "seconds": format_duration},
+            numeric_keys={"start", "end", "seconds"},
+        )
+        self.summary_table = ProviderTableWidget(self.summary_model)
+        self.sessions_table = ProviderTableWidget(self.sessions_model)
+
+        self.screen_label = QLabel()
+        self.refresh_btn = QPushButton("Refresh")
+        self.refresh_btn.clicked.connect(lambda: self.refresh_sessions(refresh=True))
+
+        top = QHBoxLayout()
+        top.addWidget(self.screen_label, 1)
+        top.addWidget(self.refresh_btn)
+
+        splitter = QSplitter(Qt.Vertical)
+        splitter.addWidget(self.summary_table)
+        splitter.addWidget(self.sessions_table)
+
+        layout = QVBoxLayout(self)
+        layout.addLayout(top)
+        layout.addWidget(splitter)
+
+        self.refresh_sessions()
+
+    def refresh_sessions(self, refresh=False):
+        self.summary_model.clear()
+        self.sessions_model.clear()
+        self.refresh_btn.setEnabled(False)
+        self.screen_label.setText("Loading...")
+        self._loader = LoadWorker(lambda: self.load_sessions(refresh))
+        self._loader.signals.finished.connect(self._on_loaded)
+        self._loader.signals.failed.connect(self._on_load_failed)
+        self.thread_pool.start(self._loader)
+
+    def _on_load_failed(self, error):
+        self._loader = None
+        self.refresh_btn.setEnabled(True)
+        self.screen_label.setText(f"Failed to reconstruct sessions: {error}")
+
+    def _on_loaded(self, sessions):
+        self._loader = None
+        self.refresh_btn.setEnabled(True)
+        sessions = sessions or []
+        summary = summarize_usage_sessions(sessions)
+        self.summary_model.append_rows(summary["packages"])
+        self.sessions_model.append_rows(
+            {"start": s.start, "end": s.end, "seconds": s.seconds, "kind": s.kind,
+             "package": s.package or "", "class_name": s.class_name or "", "closed_by": s.closed_by}
+            for s in sessions
+        )
+        screen = summary["screen"]
+        self.screen_label.setText(
+            f"{len(summary['packages'])} apps, {len(sessions) - screen['sessions']} app sessions; "
+            f"screen on {format_duration(screen['seconds'])} over {screen['sessions']} sessions"
+        )
+        resize_columns_from_sample(self.summary_table.table)
+        resize_columns_from_sample(self.sessions_table.table)
+
+
+# ============================================================
+# Background acquisition
+# ============================================================
+
+# adbd multiplexes every stream over one USB transport; a handful of concurrent
+# shell/sync sockets keeps it busy without tripping its stream limits.
+DEFAULT_ADB_POOL_WIDTH = 4
+MAX_ADB_POOL_WIDTH = 16
+
+# Extra attempts per file before a bulk pull gives up on it.
+DEFAULT_TRANSFER_RETRIES = 2
+
+# Lazy file sections: siblings pulled on each side of a previewed file.
+LAZY_PREFETCH_NEIGHBORS = 2
+
+# QThreadPool sizes. The runnables mostly wait on adbd, so the core-count
+# default is too small: an acquisition and a few tab loads (thread_pool), and
+# a section transfer plus on-demand preview pulls (transfer_pool), must all
+# be able to run at once; ADB traffic stays bounded by the AdbConnectionPool.
+BACKGROUND_POOL_THREADS = 8
+TRANSFER_POOL_THREADS = 8
+
+# Upper bound on the quoted file list of one `tar` command line (Android's
+# ARG_MAX is far larger; this also keeps each stream short enough to retry).
+TAR_ARG_BUDGET = 64 * 1024
+
+
+def tar_pull_command(paths):
+    # stderr is dropped so "file vanished" warnings never interleave with the archive bytes.
+    return "tar -cf - " + " ".join(shlex.quote(p) for p in paths) + " 2>/dev/null"
+
+
+def tar_job_chunks(jobs, arg_budget=TAR_ARG_BUDGET):
+    """Splits transfer jobs into groups whose tar command line stays under `arg_budget`."""
+    chunk, length = [], 0
+    for job in jobs:
+        cost = len(shlex.quote(job[0])) + 1
+        if chunk and length + cost > arg_budget:
+            yield chunk
+            chunk, length = [], 0
+        chunk.append(job)
+        length += cost
+    if chunk:
+        yield chunk
+
+
+class AcquisitionCancelled(Exception):
+    pass
+
+
+class AdbConnectionPool:
+    """
+    Bounds the number of ADB transport connections open against one device.
+    ppadb opens a fresh socket per shell/pull call, so the pool hands out
+    slots rather than sockets: every call waits for a free slot first.
+    """
+    def __init__(self, device, width=DEFAULT_ADB_POOL_WIDTH):
+        self.device = device
+        self.width = max(1, min(int(width or DEFAULT_ADB_POOL_WIDTH), MAX_ADB_POOL_WIDTH))
+        self._slots = threading.BoundedSemaphore(self.width)
+
+    @property
+    def serial(self):
+        return self.device.serial
+
+    @contextmanager
+    def connection(self):
+        with self._slots:
+            yield self.device
+
+    def shell(self, cmd, handler=None):
+        with self.connection() as device:
+            return device.shell(cmd, handler=handler)
+
+    def pull(self, src, dest):
+        with self.connection() as device:
+            return device.pull(src, dest)
+
+    def shell_lines(self, cmd):
+        # Holds the slot for as long as the caller keeps consuming lines.
+        with self.connection() as device:
+            yield from iter_shell_lines(device, cmd)
+
+    def shell_records(self, cmd, sep):
+        with self.connection() as device:
+            yield from iter_shell_records(device, cmd, sep)
+
+    @contextmanager
+    def exec_stream(self, cmd):
+        with self.connection() as device:
+            with open_exec_stream(device, cmd) as stream:
+                yield stream
+
+
+class AcquisitionSignals(QObject):
+    collector_started = pyqtSignal(str)
+    collector_finished = pyqtSignal(str, str)
+    progress = pyqtSignal(str, str)
+    finished = pyqtSignal(dict)
+    cancelled = pyqtSignal()
+    failed = pyqtSignal(str)
+
+
+class AcquisitionWorker(QRunnable):
+    """
+    Runs evidence collectors on a QThreadPool thread and streams per-collector
+    progress back to the GUI through queued signals.
+
+    collectors:   list of (name, callable) where callable(task) returns the artifact.
+                  Collectors are independent and run concurrently; ADB access is
+                  bounded separately by the AdbConnectionPool they share.
+    finalize:     optional callable(results, timings) run on the worker thread once
+                  every collector is done (e.g. writing evidence.json); its return
+                  value is emitted with `finished`.
+    max_parallel: number of collectors allowed to run at the same time.
+    Collectors must never touch Qt widgets; they report through `task.report()`
+    and should call `task.check_cancelled()` between expensive steps.
+    """
+    def __init__(self, collectors, finalize=None, max_parallel=DEFAULT_ADB_POOL_WIDTH):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.collectors = collectors
+        self.finalize = finalize
+        self.max_parallel = max(1, max_parallel)
+        self.signals = AcquisitionSignals()
+        self.timings = {}
+        self._cancel_event = threading.Event()
+
+    def cancel(self):
+        self._cancel_event.set()
+
+    def is_cancelled(self):
+        return self._cancel_event.is_set()
+
+    def check_cancelled(self):
+        if self._cancel_event.is_set():
+            raise AcquisitionCancelled()
+
+    def report(self, name, message):
+        self.signals.progress.emit(name, message)
+
+    def _run_collector(self, name, collector):
+        self.check_cancelled()
+        self.signals.collector_started.emit(name)
+        started_at = datetime.now().isoformat(timespec="seconds")
+        t0 = time.perf_counter()
+        try:
+            return collector(self)
+        finally:
+            self.timings[name] = {
+                "started": started_at,
+                "seconds": round(time.perf_counter() - t0, 3),
+            }
+
+    def run(self):
+        results = {}
+        t0 = time.perf_counter()
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_parallel) as executor:
+                futures = {
+                    executor.submit(self._run_collector, name, collector): name
+                    for name, collector in self.collectors
+                }
+                for future in as_completed(futures):
+                    name = futures[future]
+                    try:
+                        results[name] = future.result()
+                    except AcquisitionCancelled:
+                        self.cancel()
+                        continue
+                    self.signals.collector_finished.emit(name, self._summarize(results[name]))
+            self.check_cancelled()
+            self.timings["total"] = {"seconds": round(time.perf_counter() - t0, 3)}
+            summary = self.finalize(results, self.timings) if self.finalize else results
+            self.signals.finished.emit(summary or {})
+        except AcquisitionCancelled:
+            self.signals.cancelled.emit()
+        except Exception as e:
+            self.cancel()
+            self.signals.failed.emit(str(e))
+
+    @staticmethod
+    def _summarize(artifact):
+        if isinstance(artifact, EvidenceSpool):
+            return f"{len(artifact)} items"
+        if isinstance(artifact, list):
+            if len(artifact) == 1 and isinstance(artifact[0], dict) and "error" in artifact[0]:
+                return f"failed ({artifact[0]['error']})"
+            return f"{len(artifact)} items"
+        if isinstance(artifact, dict) and "error" in artifact:
+            return f"failed ({artifact['error']})"
+        return "done"
+
+
+class TransferSignals(QObject):
+    file_done = pyqtSignal(str, str)
+    file_failed = pyqtSignal(str, str)
+    progress = pyqtSignal(dict)
+    finished = pyqtSignal(dict)
+    cancelled = pyqtSignal()
+
+
+class TransferWorker(QRunnable):
+    """
+    Pulls many files into an EvidenceStore on a QThreadPool thread with
+    `workers` concurrent sync connections drawn from the AdbConnectionPool.
+
+    jobs: list of (remote_path, size, mtime) tuples from the file manifest;
+          size drives the byte-rate progress.
+    bulk: first stream the files as tar archives (see tar_job_chunks) and
+          unpack them on the fly; whatever a tar stream did not deliver (no tar
+          on the device, unreadable files) falls back to per-file pulls.
+    Each per-file pull is retried up to `retries` times; a file that still
+    fails is reported through `file_failed` and the rest of the batch carries on.
+    `file_done` carries the remote path and its blob path in the store.
+    """
+    def __init__(self, pool, store, jobs, workers=DEFAULT_ADB_POOL_WIDTH, retries=DEFAULT_TRANSFER_RETRIES,
+                 bulk=False):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.pool = pool
+        self.store = store
+        self.jobs = jobs
+        self.workers = max(1, workers)
+        self.retries = max(0, retries)
+        self.bulk = bulk
+        self.signals = TransferSignals()
+        self._cancel_event = threading.Event()
+        self._lock = threading.Lock()
+        self._state = {}
+        self._t0 = 0.0
+
+    def cancel(self):
+        self._cancel_event.set()
+
+    def is_cancelled(self):
+        return self._cancel_event.is_set()
+
+    def check_cancelled(self):
+        if self._cancel_event.is_set():
+            raise AcquisitionCancelled()
+
+    def _record(self, src, blob, size, error=None):
+        with self._lock:
+            state = self._state
+            if error is not None:
+                state["files_failed"] += 1
+            else:
+                state["files_done"] += 1
+                state["bytes_done"] += size
+            elapsed = time.perf_counter() - self._t0
+            state["seconds"] = round(elapsed, 3)
+            state["mb_per_s"] = round(state["bytes_done"] / (1024 * 1024) / elapsed, 1) if elapsed else 0.0
+            snapshot = dict(state)
+        if error is not None:
+            self.signals.file_failed.emit(src, error)
+        else:
+            self.signals.file_done.emit(src, blob)
+        self.signals.progress.emit(snapshot)
+
+    def _pull(self, src, size, mtime):
+        for attempt in range(self.retries + 1):
+            self.check_cancelled()
+            tmp = self.store.temp_path()
+            try:
+                self.pool.pull(src, tmp)
+                self._record(src, self.store.ingest_file(src, tmp, mtime), size)
+                return
+            except Exception as e:
+                if os.path.exists(tmp):
+                    os.remove(tmp)
+                if attempt == self.retries:
+                    self._record(src, None, size, error=str(e))
+                    return
+                time.sleep(0.5 * (attempt + 1))
+
+    def _tar_chunk(self, chunk):
+        """Streams one tar archive of `chunk` and unpacks it; returns the remote paths delivered."""
+        by_path = {src: (size, mtime) for src, size, mtime in chunk}
+        delivered = set()
+        try:
+            with self.pool.exec_stream(tar_pull_command([src for src, _, _ in chunk])) as stream:
+                with tarfile.open(fileobj=stream, mode="r|") as archive:
+                    for member in archive:
+                        self.check_cancelled()
+                        src = "/" + member.name.lstrip("/")
+                        if not member.isfile() or src not in by_path:
+                            continue
+                        size, mtime = by_path[src]
+                        with archive.extractfile(member) as fin:
+                            blob = self.store.ingest_stream(src, fin, mtime)
+                        delivered.add(src)
+                        self._record(src, blob, size)
+        except AcquisitionCancelled:
+            raise
+        except Exception:
+            pass  # truncated stream or no tar: the undelivered files go per-file
+        return delivered
+
+    def run(self):
+        self._state = {"bytes_done": 0, "bytes_total": sum(size for _, size, _ in self.jobs), "files_done": 0,
+                       "files_failed": 0, "files_total": len(self.jobs), "mb_per_s": 0.0, "seconds": 0.0}
+        self._t0 = time.perf_counter()
+        try:
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                pending = self.jobs
+                if self.bulk and pending:
+                    delivered = set()
+                    for paths in executor.map(self._tar_chunk, tar_job_chunks(pending)):
+                        delivered |= paths
+                    pending = [job for job in pending if job[0] not in delivered]
+                    self._state["tar_files"] = len(delivered)
+                futures = [executor.submit(self._pull, *job) for job in pending]
+                for future in as_completed(futures):
+                    try:
+                        future.result()
+                    except AcquisitionCancelled:
+                        for f in futures:
+                            f.cancel()
+                        raise
+            self.check_cancelled()
+            self.signals.finished.emit(dict(self._state))
+        except AcquisitionCancelled:
+            self.signals.cancelled.emit()
+        finally:
+            self.store.save()
+
+
+class LoadSignals(QObject):
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+
+class LoadWorker(QRunnable):
+    """
+    Runs one blocking load (an artifact-cache lookup, a dump parse) on a
+    QThreadPool thread so a tab can show itself at once and fill in from
+    `finished`. The caller keeps a reference until a signal arrives.
+    """
+    def __init__(self, load):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.load = load
+        self.signals = LoadSignals()
+
+    def run(self):
+        try:
+            result = self.load()
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.finished.emit(result)
 
 
 # ============================================================
@@ -570,6 +2819,31 @@ class SettingsPage(QWidget):
         api_box.setLayout(apil)
         layout.addWidget(api_box)
 
+        acq_box = QGroupBox("Acquisition")
+        acql = QHBoxLayout()
+        acql.addWidget(QLabel("Concurrent ADB connections:"))
+        self.pool_width_spin = QSpinBox()
+        self.pool_width_spin.setRange(1, MAX_ADB_POOL_WIDTH)
+        self.pool_width_spin.setValue(DEFAULT_ADB_POOL_WIDTH)
+        acql.addWidget(self.pool_width_spin)
+        acql.addWidget(QLabel("Calls/SMS since:"))
+        self.since_input = QLineEdit()
+        self.since_input.setPlaceholderText("YYYY-MM-DD (empty = all)")
+        acql.addWidget(self.since_input)
+        self.compress_dump_check = QCheckBox("Compress local usage dump")
+        acql.addWidget(self.compress_dump_check)
+        self.tar_pull_check = QCheckBox("Bulk pull via tar")
+        self.tar_pull_check.setChecked(True)
+        acql.addWidget(self.tar_pull_check)
+        self.skip_unchanged_check = QCheckBox("Skip unchanged files")
+        self.skip_unchanged_check.setChecked(True)
+        acql.addWidget(self.skip_unchanged_check)
+        self.lazy_pull_check = QCheckBox("Pull files only when previewed")
+        acql.addWidget(self.lazy_pull_check)
+        acql.addStretch(1)
+        acq_box.setLayout(acql)
+        layout.addWidget(acq_box)
+
         btn_row = QHBoxLayout()
         self.save_btn = QPushButton("Save & Test Connection")
         self.save_btn.clicked.connect(self.save_and_test)
@@ -639,6 +2913,12 @@ class SettingsPage(QWidget):
         self.online_key_input.setText(cfg.get("openai_key", ""))
         self.local_url_input.setText(cfg.get("host_url", ""))
         self.local_model_input.setText(cfg.get("model", ""))
+        self.pool_width_spin.setValue(int(cfg.get("adb_pool_width", DEFAULT_ADB_POOL_WIDTH)))
+        self.since_input.setText(cfg.get("acquire_since", "") or "")
+        self.compress_dump_check.setChecked(bool(cfg.get("compress_usage_dump", False)))
+        self.tar_pull_check.setChecked(bool(cfg.get("tar_bulk_pull", True)))
+        self.skip_unchanged_check.setChecked(bool(cfg.get("skip_unchanged_pulls", True)))
+        self.lazy_pull_check.setChecked(bool(cfg.get("lazy_file_pull", False)))
 
         theme = cfg.get("theme")
         if theme:
@@ -656,6 +2936,12 @@ class SettingsPage(QWidget):
             "openai_key": self.online_key_input.text().strip(),
             "host_url": self.local_url_input.text().strip(),
             "model": self.local_model_input.text().strip(),
+            "adb_pool_width": self.pool_width_spin.value(),
+            "acquire_since": self.since_input.text().strip(),
+            "compress_usage_dump": self.compress_dump_check.isChecked(),
+            "tar_bulk_pull": self.tar_pull_check.isChecked(),
+            "skip_unchanged_pulls": self.skip_unchanged_check.isChecked(),
+            "lazy_file_pull": self.lazy_pull_check.isChecked(),
             "theme": self.theme_dropdown.currentText() if self.theme_dropdown.currentText() != "Default (None)" else None
         }
         try:
@@ -700,9 +2986,33 @@ class DroidForen(QMainWindow):
         self.setFont(QFont("Segoe UI", 10))
 
         self.device = None
+        self.adb_pool = None
+        self.acquisition_marks = None
+        self.acquired_spools = {}
+        self.artifact_cache = ArtifactCache()
         self.devices_map = {}
         self._chat_open = False
 
+        # Background acquisition (see AcquisitionWorker)
+        self.thread_pool = QThreadPool()
+        self.thread_pool.setMaxThreadCount(max(self.thread_pool.maxThreadCount(), BACKGROUND_POOL_THREADS))
+        # File pulls get their own pool so they never queue behind acquisition or tab loads.
+        self.transfer_pool = QThreadPool()
+        self.transfer_pool.setMaxThreadCount(TRANSFER_POOL_THREADS)
+        self._acquisition = None
+        self._acquisition_item = None
+        self._acquisition_children = {}
+        self._transfer = None
+        self._transfer_section = None
+        self._manifest_loads = {}  # section -> LoadWorker walking the manifest for it
+        # Device path -> sidebar child / DeviceFile, across every listed file section
+        self._file_items = {}
+        self._file_entries = {}
+        # Lazy mode: per-click pulls (see _pull_on_demand)
+        self._on_demand_workers = set()
+        self._on_demand_paths = set()
+        self._preview_on_arrival = set()  # in-flight paths the analyst clicked
+
         # WhatsApp removed completely from file-types
         self.ext_map = {
             "Photos": {".jpg", ".jpeg", ".png"},
@@ -714,7 +3024,7 @@ class DroidForen(QMainWindow):
 
         self.SectionList = [
             "Call Logs", "SMS", "Photos", "Videos",
-            "Audio", "Documents", "Contacts", "Archives", "Usage Stats"
+            "Audio", "Documents", "Contacts", "Archives", "Usage Stats", "Usage Sessions"
         ]
 
         self.project_root = os.path.dirname(os.path.abspath(__file__))
@@ -782,6 +3092,21 @@ class DroidForen(QMainWindow):
         self.setStatusBar(self.statusBar)
         self.statusBar.showMessage("Not Connected")
 
+        self.cancel_acquisition_btn = QPushButton("Cancel")
+        self.cancel_acquisition_btn.clicked.connect(self.cancel_acquisition)
+        self.cancel_acquisition_btn.setVisible(False)
+        self.statusBar.addPermanentWidget(self.cancel_acquisition_btn)
+
+        self.transfer_progress = QProgressBar()
+        self.transfer_progress.setRange(0, 1000)  # permille: byte totals overflow a C int
+        self.transfer_progress.setMaximumWidth(220)
+        self.transfer_progress.setVisible(False)
+        self.statusBar.addPermanentWidget(self.transfer_progress)
+        self.cancel_transfer_btn = QPushButton("Cancel Transfer")
+        self.cancel_transfer_btn.clicked.connect(self.cancel_transfer)
+        self.cancel_transfer_btn.setVisible(False)
+        self.statusBar.addPermanentWidget(self.cancel_transfer_btn)
+
         self.sidebarTree.setVisible(False)
         self.previewTabs.setVisible(False)
         self.toolbar.setVisible(False)
@@ -882,22 +3207,22 @@ class DroidForen(QMainWindow):
                 return
 
             self.device = live_devices[deviceselect]
+            self.adb_pool = AdbConnectionPool(
+                self.device, (self.loaded_config or {}).get("adb_pool_width", DEFAULT_ADB_POOL_WIDTH)
+            )
             self.statusBar.showMessage(f"Connected to {self.device.serial}")
 
-            info = {
-                "Model": self.device.shell("getprop ro.product.model").strip(),
-                "Manufacturer": self.device.shell("getprop ro.product.manufacturer").strip(),
-                "Android Version": self.device.shell("getprop ro.build.version.release").strip(),
-                "Device Name": self.device.shell("getprop ro.product.device").strip(),
-                "Serial Number": self.device.shell("getprop ro.serialno").strip(),
-                "CPU ABI": self.device.shell("getprop ro.product.cpu.abi").strip()
-            }
+            props = probe_device_properties(self.device)
+            info = device_info_summary(props)
 
             self.sidebarTree.clear()
             device_root = QTreeWidgetItem(["Connected Device"])
             for key, value in info.items():
                 child = QTreeWidgetItem([f"{key}: {value}"])
                 device_root.addChild(child)
+            props_root = QTreeWidgetItem([f"All Properties ({len(props)})"])
+            props_root.addChildren([QTreeWidgetItem([f"{k}: {v}"]) for k, v in sorted(props.items())])
+            device_root.addChild(props_root)
             self.sidebarTree.addTopLevelItem(device_root)
             self.sidebarTree.addTopLevelItems(QTreeWidgetItem([section]) for section in self.SectionList)
             self.sidebarTree.setVisible(True)
@@ -917,11 +3242,18 @@ class DroidForen(QMainWindow):
             self.statusBar.showMessage(f"Connection failed: {e}")
 
     def disconnect_device(self):
+        self._detach_acquisition()
+        self.cancel_transfer()
+        self._manifest_loads.clear()
+        self.artifact_cache.invalidate()
         # Cleanup tabs (VLC etc.)
         self._close_all_tabs_cleanup()
         shutil.rmtree(self.temp_dir, ignore_errors=True)
         os.makedirs(self.temp_dir, exist_ok=True)
         self.sidebarTree.clear()
+        self._acquisition_item = None
+        self._file_items = {}
+        self._file_entries = {}
         self.previewTabs.clear()
         self.sidebarTree.setVisible(False)
         self.previewTabs.setVisible(False)
@@ -936,40 +3268,199 @@ class DroidForen(QMainWindow):
     def evidence_file_path(self):
         return os.path.join(self.project_root, "evidence.json")
 
+    def case_dir(self, serial=None):
+        serial = serial or (self.device.serial if self.device else "unknown")
+        return os.path.join(self.project_root, "Cases", re.sub(r'[^\w.-]', "_", serial))
+
+    def file_manifest_path(self):
+        return os.path.join(self.case_dir(), "file_manifest.jsonl")
+
+    def evidence_store(self):
+        return self.artifact_cache.get(self.device.serial, "evidence_store",
+                                       loader=lambda: EvidenceStore(os.path.join(self.case_dir(), "store")),
+                                       ttl=float("inf"))
+
+    # Collector name -> label shown in the status bar and sidebar progress node
+    COLLECTOR_LABELS = {
+        "calls": "Call Logs",
+        "sms": "SMS",
+        "contacts": "Contacts",
+        "files": "Files",
+        "usage_stats": "Usage Stats",
+        "usage_sessions": "Usage Sessions",
+    }
+
+    # Columns the report generator reads from evidence.json, per provider.
+    REPORT_COLUMNS = {
+        "calls": ["_id", "number", "name", "type", "date", "duration"],
+        "sms": ["_id", "thread_id", "address", "date", "type", "read", "body"],
+    }
+    # Columns each provider tab displays.
+    TAB_COLUMNS = {
+        "calls": ["name", "number", "type", "date", "duration"],
+        "sms": ["_id", "address", "date", "type", "read", "body"],
+        "contacts": ["_id", "name", "number", "type", "label"],
+    }
+    NUMERIC_COLUMNS = {"_id", "thread_id", "date", "duration", "type", "read"}
+
+    def provider_columns(self, name):
+        # Acquisition projects the union of what the report and the tab need.
+        columns = list(self.REPORT_COLUMNS.get(name, []))
+        columns += [c for c in self.TAB_COLUMNS.get(name, []) if c not in columns]
+        return columns
+
+    def compress_usage_dump(self):
+        return bool((self.loaded_config or {}).get("compress_usage_dump", False))
+
+    def tar_bulk_pull(self):
+        return bool((self.loaded_config or {}).get("tar_bulk_pull", True))
+
+    def skip_unchanged_pulls(self):
+        return bool((self.loaded_config or {}).get("skip_unchanged_pulls", True))
+
+    def lazy_file_pull(self):
+        return bool((self.loaded_config or {}).get("lazy_file_pull", False))
+
+    def acquisition_since_ms(self):
+        since = (self.loaded_config or {}).get("acquire_since")
+        if not since:
+            return None
+        try:
+            return int(datetime.strptime(since, "%Y-%m-%d").timestamp() * 1000)
+        except ValueError:
+            return None
+
     def collect_evidence(self, device_info=None):
-        self.statusBar.showMessage("Collecting evidence...")
-        evidence = {}
+        """
+        Starts evidence acquisition on the thread pool. The GUI stays responsive;
+        progress is reported in the status bar and under an "Acquisition" node
+        in the sidebar, and evidence.json is written once all collectors finish.
+        """
+        if self._acquisition is not None:
+            self.statusBar.showMessage("Acquisition already running.")
+            return
         try:
             if device_info is None:
-                device_info = {
-                    "Model": self.device.shell("getprop ro.product.model").strip(),
-                    "Manufacturer": self.device.shell("getprop ro.product.manufacturer").strip(),
-                    "Android Version": self.device.shell("getprop ro.build.version.release").strip(),
-                    "Device Name": self.device.shell("getprop ro.product.device").strip(),
-                    "Serial Number": self.device.shell("getprop ro.serialno").strip(),
-                    "CPU ABI": self.device.shell("getprop ro.product.cpu.abi").strip()
-                }
+                device_info = device_info_summary(probe_device_properties(self.device))
         except Exception as e:
             device_info = {"error": f"Failed to read device props: {e}"}
 
-        calls = self._collect_call_logs()
-        sms = self._collect_sms()
-        files = self._collect_files_summary(limit=200)
-        usage_stats = self._collect_usage_stats()
-
+        self.acquisition_marks = HighWaterMarks(os.path.join(self.case_dir(), "marks.json"))
+        self.acquired_spools = {}
+        collectors = [
+            ("calls", self._collect_call_logs),
+            ("sms", self._collect_sms),
+            ("contacts", self._collect_contacts),
+            ("files", lambda task: self._collect_files_summary(limit=200, task=task)),
+            ("usage_stats", self._collect_usage_stats),
+            ("usage_sessions", self._collect_usage_sessions),
+        ]
+        worker = AcquisitionWorker(
+            collectors,
+            finalize=lambda results, timings: self._write_evidence(device_info, results, timings),
+            max_parallel=self.adb_pool.width,
+        )
+        worker.signals.collector_started.connect(self._current_acquisition_only(worker, self._on_collector_started))
+        worker.signals.collector_finished.connect(self._current_acquisition_only(worker, self._on_collector_finished))
+        worker.signals.progress.connect(self._current_acquisition_only(worker, self._on_collector_progress))
+        worker.signals.finished.connect(self._current_acquisition_only(worker, self._on_acquisition_finished))
+        worker.signals.cancelled.connect(self._current_acquisition_only(worker, self._on_acquisition_cancelled))
+        worker.signals.failed.connect(self._current_acquisition_only(worker, self._on_acquisition_failed))
+        self._acquisition = worker
+
+        self._acquisition_item = QTreeWidgetItem(["Acquisition"])
+        self._acquisition_children = {}
+        for name, _ in collectors:
+            child = QTreeWidgetItem([f"{self.COLLECTOR_LABELS.get(name, name)}: queued"])
+            self._acquisition_children[name] = child
+            self._acquisition_item.addChild(child)
+        self.sidebarTree.insertTopLevelItem(1, self._acquisition_item)
+        self._acquisition_item.setExpanded(True)
+
+        self.cancel_acquisition_btn.setVisible(True)
+        self.statusBar.showMessage("Collecting evidence...")
+        self.thread_pool.start(worker)
+
+    def cancel_acquisition(self):
+        if self._acquisition is not None:
+            self._acquisition.cancel()
+            self.statusBar.showMessage("Cancelling acquisition...")
+
+    def _detach_acquisition(self):
+        """Cancels the running acquisition and forgets it at once; its late signals are ignored."""
+        if self._acquisition is not None:
+            self._acquisition.cancel()
+        self._acquisition = None
+        self.cancel_acquisition_btn.setVisible(False)
+
+    def _current_acquisition_only(self, worker, handler):
+        # Signals of a worker detached by disconnect_device arrive after a reconnect; drop them.
+        return lambda *args: handler(*args) if worker is self._acquisition else None
+
+    def _write_evidence(self, device_info, results, timings=None):
+        # Runs on the acquisition thread: no widget access here.
         case_id = f"CASE-{device_info.get('Serial Number','unknown')}-{datetime.now().strftime('%Y%m%d%H%M%S')}"
-        evidence["device_info"] = {"case_id": case_id, **device_info}
-        evidence["files"] = files
-        evidence["calls"] = calls
-        evidence["sms"] = sms
-        evidence["usage_stats"] = usage_stats
-
         try:
-            with open(self.evidence_file_path(), "w", encoding="utf-8") as f:
-                json.dump(evidence, f, indent=2)
-            self.statusBar.showMessage(f"Evidence saved to {self.evidence_file_path()}")
+            device_properties = probe_device_properties(self.device)
+        except Exception as e:
+            device_properties = {"error": f"Failed to read device props: {e}"}
+        evidence = {
+            "device_info": {"case_id": case_id, **device_info},
+            "device_properties": device_properties,
+            "acquisition": {
+                "adb_pool_width": self.adb_pool.width if self.adb_pool else 1,
+                "timings": timings or {},
+            },
+            "files": results.get("files", []),
+            "calls": results.get("calls", []),
+            "sms": results.get("sms", []),
+            "contacts": results.get("contacts", []),
+            "usage_stats": results.get("usage_stats", []),
+            "usage_sessions": results.get("usage_sessions", {}),
+        }
+        self.acquired_spools = {k: v for k, v in results.items() if isinstance(v, EvidenceSpool)}
+        try:
+            write_evidence_json(self.evidence_file_path(), evidence)
+            return {"path": self.evidence_file_path()}
         except Exception as e:
-            self.statusBar.showMessage(f"Failed to save evidence.json: {e}")
+            return {"error": f"Failed to save evidence.json: {e}"}
+
+    def _set_acquisition_status(self, name, status):
+        if self._acquisition_item is None or name not in self._acquisition_children:
+            return
+        self._acquisition_children[name].setText(0, f"{self.COLLECTOR_LABELS.get(name, name)}: {status}")
+
+    def _on_collector_started(self, name):
+        self._set_acquisition_status(name, "running...")
+        self.statusBar.showMessage(f"Collecting {self.COLLECTOR_LABELS.get(name, name)}...")
+
+    def _on_collector_progress(self, name, message):
+        self._set_acquisition_status(name, message)
+        self.statusBar.showMessage(f"{self.COLLECTOR_LABELS.get(name, name)}: {message}")
+
+    def _on_collector_finished(self, name, summary):
+        self._set_acquisition_status(name, summary)
+
+    def _end_acquisition(self, title):
+        self._acquisition = None
+        self.cancel_acquisition_btn.setVisible(False)
+        if self._acquisition_item is not None:
+            self._acquisition_item.setText(0, title)
+
+    def _on_acquisition_finished(self, summary):
+        self._end_acquisition("Acquisition (complete)")
+        if "error" in summary:
+            self.statusBar.showMessage(summary["error"])
+        else:
+            self.statusBar.showMessage(f"Evidence saved to {summary.get('path', self.evidence_file_path())}")
+
+    def _on_acquisition_cancelled(self):
+        self._end_acquisition("Acquisition (cancelled)")
+        self.statusBar.showMessage("Acquisition cancelled")
+
+    def _on_acquisition_failed(self, message):
+        self._end_acquisition("Acquisition (failed)")
+        self.statusBar.showMessage(f"Evidence collection failed: {message}")
 
     def cleanup_evidence(self):
         try:
@@ -980,95 +3471,168 @@ class DroidForen(QMainWindow):
         except Exception as e:
             self.statusBar.showMessage(f"Failed to remove evidence.json: {e}")
 
-    def _collect_call_logs(self):
+    def _artifact_spool(self, name, mark, **scope):
+        """
+        Opens Cases/<serial>/<name>.jsonl. The existing rows are kept only when
+        a high-water mark recorded under the same scope (e.g. the "since"
+        window) exists for them; otherwise the artifact is acquired from scratch.
+        """
+        path = os.path.join(self.case_dir(), f"{name}.jsonl")
+        resume = bool(mark) and os.path.exists(path) and all(mark.get(k) == v for k, v in scope.items())
+        if not resume:
+            self.acquisition_marks.clear(name)
+        return EvidenceSpool(path, truncate=not resume), (mark if resume else None)
+
+    def _collect_provider(self, name, task=None):
+        # Paged: each window is appended to Cases/<serial>/<name>.jsonl and dropped.
         try:
-            raw = self.device.shell("content query --uri content://call_log/calls")
-            entries = []
-            for block in raw.split("Row"):
-                if not block.strip():
-                    continue
-                entry = {}
-                for part in block.split(","):
-                    if "=" in part:
-                        k, v = part.strip().split("=", 1)
-                        entry[k.strip()] = v.strip()
-                if entry:
-                    entries.append(entry)
-            return entries
+            since_ms = self.acquisition_since_ms()
+            spool, mark = self._artifact_spool(name, self.acquisition_marks.get(name), since_ms=since_ms)
+            after_id = mark["max_id"] if mark else None
+            new_rows = 0
+            pages = iter_provider_pages(self.adb_pool, name, self.provider_columns(name),
+                                        since_ms=since_ms, after_id=after_id)
+            for page in pages:
+                # Checked before the page lands: a cancelled (possibly detached) worker writes nothing more.
+                if task:
+                    task.check_cancelled()
+                spool.append(page)
+                new_rows += len(page)
+                try:
+                    after_id = max(int(row["_id"]) for row in page)
+                    self.acquisition_marks.update(name, {"max_id": after_id, "since_ms": since_ms})
+                except (KeyError, ValueError):
+                    pass
+                if task:
+                    task.report(name, f"{len(spool)} rows ({new_rows} new)...")
+            return spool
+        except AcquisitionCancelled:
+            raise
         except Exception as e:
             return [{"error": str(e)}]
 
-    def _collect_sms(self):
+    def _collect_call_logs(self, task=None):
+        return self._collect_provider("calls", task)
+
+    def _collect_sms(self, task=None):
+        return self._collect_provider("sms", task)
+
+    def _collect_contacts(self, task=None):
+        return self._collect_provider("contacts", task)
+
+    def file_manifest(self, refresh=False, task=None):
+        """
+        The device file manifest, shared by the file sections and the files
+        collector. It is re-walked at most every FILE_MANIFEST_TTL seconds, so
+        reopening a section later picks up files that changed on the device.
+        """
+        if self.device is None:
+            return None
+        return self.artifact_cache.get(
+            self.device.serial, "file_manifest",
+            loader=lambda: FileManifest(self.file_manifest_path(), self.ext_map).build(self.adb_pool, task=task),
+            refresh=refresh, ttl=FILE_MANIFEST_TTL,
+        )
+
+    def _collect_files_summary(self, limit=200, task=None):
         try:
-            raw = self.device.shell("content query --uri content://sms/")
-            entries = []
-            for block in raw.split("Row"):
-                if not block.strip():
-                    continue
-                entry = {}
-                for part in block.split(","):
-                    if "=" in part:
-                        k, v = part.strip().split("=", 1)
-                        entry[k.strip()] = v.strip()
-                if entry:
-                    entries.append(entry)
-            return entries
+            manifest = self.file_manifest(task=task)
+            return [{**f.to_dict(), "type": category} for category, f in manifest.classified[:limit]]
+        except AcquisitionCancelled:
+            raise
         except Exception as e:
             return [{"error": str(e)}]
 
-    def _collect_files_summary(self, limit=200):
+    def usage_events(self, refresh=False, load=True):
+        """
+        Parsed usage events for the connected device, shared through the
+        artifact cache by the acquisition, the Usage Stats tab, export and report.
+        """
+        if self.device is None:
+            return None
+        if refresh:
+            self.artifact_cache.invalidate(self.device.serial, "usage_sessions")
+        return self.artifact_cache.get(self.device.serial, "usage_stats",
+                                       loader=self._load_usage_events if load else None, refresh=refresh)
+
+    def usage_sessions(self, refresh=False, load=True):
+        """Sessions reconstructed from usage_events(), cached alongside them."""
+        if self.device is None:
+            return None
+        if refresh:
+            self.usage_events(refresh=True)
+        return self.artifact_cache.get(self.device.serial, "usage_sessions",
+                                       loader=(lambda: build_usage_sessions(self.usage_events())) if load else None)
+
+    def _load_usage_events(self):
+        local_file = usage_dump_path(os.path.join(self.temp_dir, "UsageStats"), self.compress_usage_dump())
+        return list(stream_usage_events(self.adb_pool.shell_lines(USAGE_DUMP_CMD), tee_path=local_file))
+
+    def _collect_usage_stats(self, task=None):
         try:
-            paths_to_scan = ["/sdcard/DCIM", "/sdcard/Pictures", "/sdcard/Documents", "/sdcard/Download", "/sdcard/Movies", "/sdcard/Music"]
-            files = []
-            count = 0
-            for base in paths_to_scan:
-                try:
-                    raw = self.device.shell(f"ls -R {base}")
-                except Exception:
+            events = self.usage_events()
+            if task:
+                task.check_cancelled()
+            spool, mark = self._artifact_spool("usage_stats", self.acquisition_marks.get("usage_stats"),
+                                               schema=USAGE_EVENT_SCHEMA)
+            last_time = mark["last_epoch"] if mark else None
+            # Dumpsys times have one-second resolution: events in the mark's second are
+            # matched by key (with multiplicity) against those already spooled.
+            spooled_at_mark = dict(mark.get("keys_at_last", {})) if mark else {}
+            newest, keys_at_newest = last_time, dict(spooled_at_mark)
+            batch, added = [], 0
+            for ev in events:
+                if last_time is not None and ev.time < last_time:
                     continue
-                current_dir = base
-                for line in raw.splitlines():
-                    line = line.strip()
-                    if not line:
-                        continue
-                    if line.endswith(":"):
-                        current_dir = line[:-1].strip()
-                        if not current_dir.startswith("/"):
-                            current_dir = f"/{current_dir}"
-                        continue
-                    for part in line.split():
-                        lower = part.lower()
-                        for cat, exts in self.ext_map.items():
-                            if any(lower.endswith(ext) for ext in exts):
-                                files.append({"path": f"{current_dir}/{part}", "type": cat})
-                                count += 1
-                                break
-                        if count >= limit:
-                            break
-                    if count >= limit:
-                        break
-                if count >= limit:
-                    break
-            return files
+                key = ev.key()
+                if ev.time == last_time and spooled_at_mark.get(key, 0) > 0:
+                    spooled_at_mark[key] -= 1
+                    continue
+                batch.append(ev.to_dict())
+                added += 1
+                if newest is None or ev.time > newest:
+                    newest, keys_at_newest = ev.time, {}
+                if ev.time == newest:
+                    keys_at_newest[key] = keys_at_newest.get(key, 0) + 1
+                if len(batch) >= DEFAULT_PROVIDER_PAGE_SIZE:
+                    if task:
+                        task.check_cancelled()
+                    spool.append(batch)
+                    batch = []
+                    if task:
+                        task.report("usage_stats", f"{len(spool)} events...")
+            if task:
+                task.check_cancelled()
+            spool.append(batch)
+            if added:
+                self.acquisition_marks.update("usage_stats", {"last_epoch": newest, "keys_at_last": keys_at_newest,
+                                                              "schema": USAGE_EVENT_SCHEMA})
+            return spool
+        except AcquisitionCancelled:
+            raise
         except Exception as e:
-            return [{"error": str(e)}]
+            return [{"error": f"usage_stats: {e}"}]
 
-    def _collect_usage_stats(self):
+    def _collect_usage_sessions(self, task=None):
         try:
-            out_dir = os.path.join(self.temp_dir, "UsageStats")
-            os.makedirs(out_dir, exist_ok=True)
-            self.device.shell('sh -c "dumpsys usagestats > /sdcard/usage_dump.txt"')
-            local_file = os.path.join(out_dir, "usage_dump.txt")
-            self.device.pull("/sdcard/usage_dump.txt", local_file)
-            return parse_usage_events(local_file)
+            sessions = self.usage_sessions()
+            if task:
+                task.check_cancelled()
+            return {
+                **summarize_usage_sessions(sessions),
+                "sessions": [s.to_dict() for s in sessions],
+            }
+        except AcquisitionCancelled:
+            raise
         except Exception as e:
-            return [{"error": f"usage_stats: {e}"}]
+            return {"error": f"usage_sessions: {e}"}
 
     # ---------------------------- Central Preview Helpers ----------------------------
 
-    def _open_preview_tab(self, title, path):
+    def _open_preview_tab(self, title, path, name=None):
         """
         Opens given 'path' in a new tab using the unified PreviewWidget.
+        'name' supplies the file type when 'path' is an extension-less store blob.
         """
         # Focus existing tab if same title is open
         for i in range(self.previewTabs.count()):
@@ -1076,14 +3640,14 @@ class DroidForen(QMainWindow):
                 self.previewTabs.setCurrentIndex(i)
                 return
 
-        widget = PreviewWidget(path, temp_dir=self.temp_dir)
+        widget = PreviewWidget(path, temp_dir=self.temp_dir, name=name)
         idx = self.previewTabs.addTab(widget, title)
         self.previewTabs.setCurrentIndex(idx)
 
     def _close_tab_cleanup(self, index):
         w = self.previewTabs.widget(index)
         try:
-            if isinstance(w, PreviewWidget):
+            if isinstance(w, (PreviewWidget, UsageStatsWidget)):
                 w.cleanup()
         except Exception:
             pass
@@ -1102,13 +3666,22 @@ class DroidForen(QMainWindow):
         # File click under media/doc trees -> preview
         file_sections = {"Photos", "Videos", "Audio", "Documents", "Archives"}
         if parent and parent.text(0) in file_sections:
-            # The file was pulled earlier into TempData/<Section>/
-            local_path = os.path.join(self.temp_dir, parent.text(0), title)
-            if os.path.exists(local_path):
+            # The file was pulled earlier into the evidence store, or is pulled now in lazy mode
+            device_path = item.data(0, Qt.UserRole)
+            if device_path in self._on_demand_paths:
+                # Already being pulled (clicked before, or prefetched): preview it when it lands.
+                self._preview_on_arrival.add(device_path)
+                self.statusBar.showMessage(f"Still pulling {title}...")
+                return
+            if device_path and self.lazy_file_pull() and self._needs_pull(device_path):
+                self._pull_on_demand(item)
+                return
+            local_path = self.evidence_store().path_for(device_path) if device_path else None
+            if local_path:
                 # Use unified preview
-                self._open_preview_tab(title, local_path)
+                self._open_preview_tab(title, local_path, name=device_path.rsplit("/", 1)[-1])
             else:
-                self.open_tab("Error", f"File not found locally: {local_path}")
+                self.open_tab("Error", f"File not pulled yet: {device_path or title}")
             return
 
         # Top-level tabs
@@ -1120,15 +3693,17 @@ class DroidForen(QMainWindow):
         if title == "Call Logs":
             self.show_call_logs()
         elif title == "SMS":
-            content = self.device.shell("content query --uri content://sms/")
-            self.open_tab(title, content)
+            self.show_sms()
         elif title == "Contacts":
-            content = self.device.shell("content query --uri content://contacts/phones/")
-            self.open_tab(title, content)
+            self.show_contacts()
         elif title == "Usage Stats":
-            usage_widget = UsageStatsWidget(self.device, self.temp_dir)
+            usage_widget = UsageStatsWidget(lambda refresh: self.usage_events(refresh=refresh), self.thread_pool)
             idx = self.previewTabs.addTab(usage_widget, "Usage Stats")
             self.previewTabs.setCurrentIndex(idx)
+        elif title == "Usage Sessions":
+            sessions_widget = UsageSessionsWidget(lambda refresh: self.usage_sessions(refresh=refresh), self.thread_pool)
+            idx = self.previewTabs.addTab(sessions_widget, "Usage Sessions")
+            self.previewTabs.setCurrentIndex(idx)
         elif title in file_sections:
             # Populate (or refresh) list of files under this section
             self.Extract(title)
@@ -1136,43 +3711,82 @@ class DroidForen(QMainWindow):
             # Any other text node (like "Connected Device" children)
             pass
 
-    def show_call_logs(self):
-        try:
-            raw = self.device.shell("content query --uri content://call_log/calls")
-            entries = [e.strip() for e in raw.split("Row") if e.strip()]
-            headers = ["Name", "Number", "Type", "Date", "Duration"]
-            table = QTableWidget()
-            table.setColumnCount(len(headers))
-            table.setHorizontalHeaderLabels(headers)
-            table.setRowCount(len(entries))
-            for row_idx, entry in enumerate(entries):
-                entry_dict = {}
-                for part in entry.split(","):
-                    if "=" in part:
-                        key, val = part.strip().split("=", 1)
-                        val = val.strip()
-                        if val in ("NULL", ""):
-                            val = "N/A"
-                        entry_dict[key.strip()] = val
-
-                name = entry_dict.get("name", "N/A")
-                number = entry_dict.get("number", "N/A")
-                call_type = self.call_type(entry_dict.get("type", "0"))
-                date = self.format_date(entry_dict.get("date", "0"))
-                duration = f"{entry_dict.get('duration', '0')} sec"
-
-                table.setItem(row_idx, 0, QTableWidgetItem(name))
-                table.setItem(row_idx, 1, QTableWidgetItem(number))
-                table.setItem(row_idx, 2, QTableWidgetItem(call_type))
-                table.setItem(row_idx, 3, QTableWidgetItem(date))
-                table.setItem(row_idx, 4, QTableWidgetItem(duration))
-
-            table.resizeColumnsToContents()
-            index = self.previewTabs.addTab(table, "Call Logs")
-            self.previewTabs.setCurrentIndex(index)
+    @staticmethod
+    def _na(value):
+        value = (value or "").strip()
+        return "N/A" if value in ("NULL", "") else value
 
+    def _iter_provider_rows(self, name):
+        """
+        Rows for a provider tab: the acquired spool when acquisition has
+        finished, otherwise a query for just the tab's columns on an ADB pool
+        connection. Nothing is read until the iterator is consumed (on a LoadWorker).
+        """
+        spool = self.acquired_spools.get(name)
+        if spool is not None and self._acquisition is None:
+            return iter(spool)
+        columns = self.TAB_COLUMNS[name]
+        cmd = provider_query_command(name, projection=columns, sort="_id ASC", since_ms=self.acquisition_since_ms())
+        return iter_content_rows(self.adb_pool.shell_lines(cmd), columns)
+
+    def _show_provider_tab(self, title, name, headers, formatters):
+        """Opens the tab at once; its rows are read on the thread pool and appended when they arrive."""
+        try:
+            model = ColumnStoreTableModel(headers, self.TAB_COLUMNS[name], formatters=formatters,
+                                          numeric_keys=self.NUMERIC_COLUMNS)
+            rows = self._iter_provider_rows(name)
         except Exception as e:
-            self.open_tab("Call Logs", f"Failed to load call logs: {e}")
+            self.open_tab(title, f"Failed to load {title.lower()}: {e}")
+            return
+
+        widget = ProviderTableWidget(model)
+        widget.set_loading(True)
+        index = self.previewTabs.addTab(widget, title)
+        self.previewTabs.setCurrentIndex(index)
+
+        def loaded(entries):
+            widget.loader = None
+            for start in range(0, len(entries), DEFAULT_PROVIDER_PAGE_SIZE):
+                model.append_rows(entries[start:start + DEFAULT_PROVIDER_PAGE_SIZE])
+            widget.set_loading(False)
+            resize_columns_from_sample(widget.table)
+
+        def failed(error):
+            widget.loader = None
+            tab = self.previewTabs.indexOf(widget)
+            if tab >= 0:
+                self.previewTabs.removeTab(tab)
+            self.open_tab(title, f"Failed to load {title.lower()}: {error}")
+
+        widget.loader = LoadWorker(lambda: list(rows))
+        widget.loader.signals.finished.connect(loaded)
+        widget.loader.signals.failed.connect(failed)
+        self.thread_pool.start(widget.loader)
+
+    def show_call_logs(self):
+        self._show_provider_tab("Call Logs", "calls", ["Name", "Number", "Type", "Date", "Duration"], {
+            "name": self._na,
+            "number": self._na,
+            "type": lambda v: self.call_type(self._na(v)),
+            "date": lambda v: self.format_date(self._na(v)),
+            "duration": lambda v: f"{self._na(v)} sec",
+        })
+
+    def show_sms(self):
+        self._show_provider_tab("SMS", "sms", ["ID", "Address", "Date", "Type", "Read", "Body"], {
+            "address": self._na,
+            "date": lambda v: self.format_date(self._na(v)),
+            "type": lambda v: self.sms_type(self._na(v)),
+            "read": lambda v: "Yes" if v == "1" else "No",
+        })
+
+    def show_contacts(self):
+        self._show_provider_tab("Contacts", "contacts", ["ID", "Name", "Number", "Type", "Label"], {
+            "name": self._na,
+            "number": self._na,
+            "type": lambda v: self.phone_type(self._na(v)),
+            "label": self._na,
+        })
 
     def open_tab(self, title, content):
         for i in range(self.previewTabs.count()):
@@ -1197,6 +3811,30 @@ class DroidForen(QMainWindow):
         }
         return mapping.get(call_type, "Unknown")
 
+    def sms_type(self, sms_type):
+        mapping = {
+            "1": "Inbox",
+            "2": "Sent",
+            "3": "Draft",
+            "4": "Outbox",
+            "5": "Failed",
+            "6": "Queued"
+        }
+        return mapping.get(sms_type, "Unknown")
+
+    def phone_type(self, phone_type):
+        mapping = {
+            "0": "Custom",
+            "1": "Home",
+            "2": "Mobile",
+            "3": "Work",
+            "4": "Work Fax",
+            "5": "Home Fax",
+            "6": "Pager",
+            "7": "Other"
+        }
+        return mapping.get(phone_type, "Unknown")
+
     def format_date(self, timestamp):
         try:
             ts = int(timestamp)
@@ -1210,67 +3848,257 @@ class DroidForen(QMainWindow):
             return
         # Open external file in central preview tab
         title = os.path.basename(file_path)
+        if title in USAGE_DUMP_NAMES:
+            self.open_usage_dump(file_path)
+            return
         self._open_preview_tab(title, file_path)
 
+    def open_usage_dump(self, file_path):
+        """
+        Re-analyses a saved usage dump in a Usage Stats tab. A plain dump is
+        served from its UsageDumpIndex; a gzip dump is parsed in full.
+        """
+        title = f"Usage: {os.path.basename(file_path)}"
+        for i in range(self.previewTabs.count()):
+            if self.previewTabs.tabText(i) == title:
+                self.previewTabs.setCurrentIndex(i)
+                return
+
+        def load(refresh):
+            if file_path.endswith(".gz"):
+                return parse_usage_events(file_path)
+            # Rows come from the sidecar (written by this first scan when missing or stale).
+            return UsageDumpIndex(file_path, rebuild=refresh)
+
+        widget = UsageStatsWidget(load, self.thread_pool)
+        idx = self.previewTabs.addTab(widget, title)
+        self.previewTabs.setCurrentIndex(idx)
+        self.previewTabs.setVisible(True)
+
     # ---------------------------- Extraction & Export ----------------------------
 
     def Extract(self, section):
         """
-        Scans typical device dirs and pulls matching files to temp/section,
-        then populates the sidebar tree children under the section.
+        Lists the section's files from the device file manifest under its
+        sidebar node and pulls, in the background, the ones that are new or
+        whose device size/mtime differ from the evidence store's record; a
+        child becomes clickable once its file is stored. In lazy mode nothing
+        is pulled here: files are fetched when first previewed (see
+        _pull_on_demand). The manifest is fetched (or re-walked once its TTL
+        has expired) on the thread pool; the section is listed when it arrives.
         """
+        if self._transfer is not None:
+            self.statusBar.showMessage(f"Still pulling {self._transfer_section}; cancel it or wait for it to finish.")
+            return
+        if section in self._manifest_loads:
+            return
+        worker = LoadWorker(self.file_manifest)
+        worker.signals.finished.connect(lambda manifest: self._list_section(worker, section, manifest))
+        worker.signals.failed.connect(lambda error: self._list_section(worker, section, None, error))
+        self._manifest_loads[section] = worker
+        self.statusBar.showMessage(f"Reading the file manifest for {section.lower()}...")
+        self.thread_pool.start(worker)
+
+    def _list_section(self, worker, section, manifest, error=None):
+        if self._manifest_loads.get(section) is not worker:
+            return  # the device was disconnected meanwhile
+        del self._manifest_loads[section]
+        if manifest is None:
+            self.open_tab(section, f"Error loading {section}: {error or 'no device connected'}")
+            return
         try:
-            temp_sub_dir = os.path.join(self.temp_dir, section)
-            os.makedirs(temp_sub_dir, exist_ok=True)
-            # Cleanup existing children files in temp for that section
-            for f in glob.glob(os.path.join(temp_sub_dir, "*")):
-                try:
-                    os.remove(f)
-                except:
-                    pass
-
-            # Scan /sdcard recursively (like previous logic)
-            raw = self.device.shell("ls -R /sdcard")
-            lines = raw.splitlines()
-            current_dir = "/sdcard"
-            file_paths = []
-            for line in lines:
-                line = line.strip()
-                if not line:
-                    continue
-                if line.endswith(":"):
-                    current_dir = line[:-1].strip()
-                    if not current_dir.startswith("/"):
-                        current_dir = f"/{current_dir}"
-                    continue
-                for part in line.split():
-                    if any(part.lower().endswith(ext) for ext in self.ext_map.get(section, set())):
-                        file_paths.append(f"{current_dir}/{part}")
-
-            downloaded = []
-            for path in file_paths:
-                filename = os.path.basename(path)
-                dest = os.path.join(temp_sub_dir, filename)
-                try:
-                    self.device.pull(path, dest)
-                    downloaded.append(dest)
-                except:
-                    pass
-
-            # Populate the section nodes with local file names
-            for i in range(self.sidebarTree.topLevelItemCount()):
-                item = self.sidebarTree.topLevelItem(i)
-                if item.text(0) == section:
-                    item.takeChildren()
-                    for file_path in downloaded:
-                        child = QTreeWidgetItem([os.path.basename(file_path)])
-                        item.addChild(child)
-                    item.setExpanded(True)
-                    break
+            store = self.evidence_store()
+            item = self._section_item(section)
+            if item is not None:
+                # Forget only this section's old children; other listed sections stay usable.
+                for old in item.takeChildren():
+                    path = old.data(0, Qt.UserRole)
+                    self._file_items.pop(path, None)
+                    self._file_entries.pop(path, None)
+
+            lazy = self.lazy_file_pull()
+            skip_unchanged = self.skip_unchanged_pulls()
+            jobs, taken, unchanged = [], set(), 0
+            for f in manifest.files(section):
+                # Same-named files from different folders get " (n)" suffixes.
+                stem, ext = os.path.splitext(f.name)
+                label, n = f.name, 1
+                while label in taken:
+                    n += 1
+                    label = f"{stem} ({n}){ext}"
+                taken.add(label)
+                child = QTreeWidgetItem([label])
+                child.setData(0, Qt.UserRole, f.path)
+                child.setToolTip(0, f.path)
+                self._file_items[f.path] = child
+                self._file_entries[f.path] = f
+                if skip_unchanged and store.is_current(f.path, f.size, f.mtime):
+                    unchanged += 1
+                elif not lazy:
+                    child.setDisabled(store.path_for(f.path) is None)
+                    jobs.append((f.path, f.size, f.mtime))
+                if item is not None:
+                    item.addChild(child)
+            if item is not None:
+                item.setExpanded(True)
+
+            if lazy:
+                self.statusBar.showMessage(f"Listed {len(taken)} {section.lower()} files; each is pulled when opened")
+            elif jobs and self._transfer is not None:
+                self.statusBar.showMessage(f"Listed {len(taken)} {section.lower()} files; "
+                                           f"open the section again once {self._transfer_section} has been pulled")
+            elif jobs:
+                self._start_transfer(section, jobs, unchanged)
+            else:
+                self.statusBar.showMessage(f"All {len(taken)} {section.lower()} files unchanged since the last pull")
 
         except Exception as e:
             self.open_tab(section, f"Error loading {section}: {e}")
 
+    def _section_item(self, section):
+        for i in range(self.sidebarTree.topLevelItemCount()):
+            item = self.sidebarTree.topLevelItem(i)
+            if item.text(0) == section:
+                return item
+        return None
+
+    def _start_transfer(self, section, jobs, unchanged=0):
+        worker = TransferWorker(self.adb_pool, self.evidence_store(), jobs, workers=self.adb_pool.width,
+                                bulk=self.tar_bulk_pull())
+        worker.signals.file_done.connect(lambda src, blob: self._on_transfer_file_done(worker, src))
+        worker.signals.file_failed.connect(lambda src, error: self._on_transfer_file_failed(worker, src, error))
+        worker.signals.progress.connect(lambda state: self._on_transfer_progress(worker, state))
+        worker.signals.finished.connect(lambda state: self._end_transfer(worker, state))
+        worker.signals.cancelled.connect(lambda: self._end_transfer(worker, None))
+        self._transfer = worker
+        self._transfer_section = section
+        self.transfer_progress.setValue(0)
+        self.transfer_progress.setVisible(True)
+        self.cancel_transfer_btn.setVisible(True)
+        skipped = f" ({unchanged} unchanged skipped)" if unchanged else ""
+        self.statusBar.showMessage(f"Pulling {len(jobs)} new or changed {section.lower()} files{skipped}...")
+        self.transfer_pool.start(worker)
+
+    def cancel_transfer(self):
+        for worker in list(self._on_demand_workers):
+            worker.cancel()
+        if self._transfer is not None:
+            self._transfer.cancel()
+            self.statusBar.showMessage("Cancelling transfer...")
+
+    def _needs_pull(self, device_path):
+        f = self._file_entries.get(device_path)
+        store = self.evidence_store()
+        if f is None:
+            return False
+        if self.skip_unchanged_pulls():
+            return not store.is_current(device_path, f.size, f.mtime)
+        return True
+
+    def _pull_on_demand(self, item):
+        """
+        Pulls a lazily listed file for preview, together with up to
+        LAZY_PREFETCH_NEIGHBORS siblings on either side that the analyst is
+        likely to open next; the preview opens once the clicked file is stored
+        (or once any prefetched file the analyst clicks meanwhile lands).
+        """
+        device_path = item.data(0, Qt.UserRole)
+        parent = item.parent()
+        index = parent.indexOfChild(item)
+        order = [index]
+        for step in range(1, LAZY_PREFETCH_NEIGHBORS + 1):
+            order += [index + step, index - step]
+        jobs = []
+        for i in order:
+            if 0 <= i < parent.childCount():
+                path = parent.child(i).data(0, Qt.UserRole)
+                if path and path not in self._on_demand_paths and self._needs_pull(path):
+                    f = self._file_entries[path]
+                    jobs.append((f.path, f.size, f.mtime))
+        if not jobs:
+            return
+
+        worker = TransferWorker(self.adb_pool, self.evidence_store(), jobs, workers=min(len(jobs), self.adb_pool.width))
+        worker.signals.file_done.connect(self._on_demand_file_done)
+        worker.signals.file_failed.connect(self._on_demand_file_failed)
+        worker.signals.finished.connect(lambda state: self._end_on_demand(worker, jobs))
+        worker.signals.cancelled.connect(lambda: self._end_on_demand(worker, jobs))
+        self._on_demand_workers.add(worker)
+        self._on_demand_paths.update(job[0] for job in jobs)
+        self._preview_on_arrival.add(device_path)
+        self.statusBar.showMessage(f"Pulling {item.text(0)}" + (f" (+{len(jobs) - 1} nearby)" if len(jobs) > 1 else "") + "...")
+        self.transfer_pool.start(worker)
+
+    def _on_demand_file_done(self, src, blob):
+        self._on_demand_paths.discard(src)
+        wanted = src in self._preview_on_arrival
+        self._preview_on_arrival.discard(src)
+        child = self._file_items.get(src)
+        if child is None:
+            return
+        child.setDisabled(False)
+        if wanted:
+            self._open_preview_tab(child.text(0), blob, name=src.rsplit("/", 1)[-1])
+
+    def _on_demand_file_failed(self, src, error):
+        self._on_demand_paths.discard(src)
+        wanted = src in self._preview_on_arrival
+        self._preview_on_arrival.discard(src)
+        if wanted and src in self._file_items:
+            self.open_tab("Error", f"Failed to pull {src}: {error}")
+
+    def _end_on_demand(self, worker, jobs):
+        self._on_demand_workers.discard(worker)
+        paths = {job[0] for job in jobs}
+        self._on_demand_paths -= paths
+        self._preview_on_arrival -= paths
+
+    def _on_transfer_file_done(self, worker, src):
+        if worker is not self._transfer:
+            return
+        child = self._file_items.get(src)
+        if child is not None:
+            child.setDisabled(False)
+
+    def _on_transfer_file_failed(self, worker, src, error):
+        if worker is not self._transfer:
+            return
+        child = self._file_items.get(src)
+        if child is not None:
+            child.setText(0, f"{child.text(0)} (failed)")
+            child.setToolTip(0, f"{src}\nPull failed: {error}")
+
+    def _on_transfer_progress(self, worker, state):
+        if worker is not self._transfer:
+            return
+        if state["bytes_total"]:
+            self.transfer_progress.setValue(int(1000 * state["bytes_done"] / state["bytes_total"]))
+        self.transfer_progress.setFormat(f"{state['files_done']}/{state['files_total']}")
+        self.statusBar.showMessage(
+            f"{self._transfer_section}: {state['files_done']}/{state['files_total']} files, "
+            f"{state['bytes_done'] / (1024 * 1024):.1f}/{state['bytes_total'] / (1024 * 1024):.1f} MB "
+            f"at {state['mb_per_s']} MB/s"
+        )
+
+    def _end_transfer(self, worker, state):
+        if worker is not self._transfer:
+            return
+        section = self._transfer_section
+        self._transfer = None
+        self._transfer_section = None
+        self.transfer_progress.setVisible(False)
+        self.cancel_transfer_btn.setVisible(False)
+        if state is None:
+            self.statusBar.showMessage(f"{section} transfer cancelled")
+            return
+        failed = f", {state['files_failed']} failed" if state["files_failed"] else ""
+        via_tar = f", {state['tar_files']} via tar" if state.get("tar_files") else ""
+        self.statusBar.showMessage(
+            f"Pulled {state['files_done']} {section.lower()} files "
+            f"({state['bytes_done'] / (1024 * 1024):.1f} MB) in {state.get('seconds', 0)}s "
+            f"at {state['mb_per_s']} MB/s{via_tar}{failed}"
+        )
+
     def export_data(self):
         current_tab_title = None
         if self.previewTabs.count() > 0 and self.previewTabs.currentIndex() >= 0:
@@ -1283,21 +4111,16 @@ class DroidForen(QMainWindow):
                 self.device.shell("ls -R /sdcard/Pictures/")
                 self.device.pull("/sdcard/Pictures/", folder)
             elif current_tab_title == "Call Logs":
-                data = self.device.shell("content query --uri content://call_log/calls")
-                with open(os.path.join(folder, "call_logs.txt"), "w", encoding="utf-8") as f:
-                    f.write(data)
+                self._export_provider("calls", os.path.join(folder, "call_logs.txt"))
             elif current_tab_title == "SMS":
-                data = self.device.shell("content query --uri content://sms/")
-                with open(os.path.join(folder, "sms.txt"), "w", encoding="utf-8") as f:
-                    f.write(data)
+                self._export_provider("sms", os.path.join(folder, "sms.txt"))
             elif current_tab_title == "Contacts":
-                data = self.device.shell("content query --uri content://contacts/phones/")
-                with open(os.path.join(folder, "contacts.txt"), "w", encoding="utf-8") as f:
-                    f.write(data)
+                self._export_provider("contacts", os.path.join(folder, "contacts.txt"))
             elif current_tab_title == "Usage Stats":
-                src = os.path.join(self.temp_dir, "UsageStats", "usage_dump.txt")
-                if os.path.exists(src):
-                    shutil.copy2(src, os.path.join(folder, "usage_dump.txt"))
+                self.usage_events()
+                src = find_usage_dump(os.path.join(self.temp_dir, "UsageStats"))
+                if src:
+                    shutil.copy2(src, os.path.join(folder, os.path.basename(src)))
                 else:
                     self.statusBar.showMessage("No local usage_dump.txt to export.")
                     return
@@ -1309,6 +4132,12 @@ class DroidForen(QMainWindow):
         except Exception as e:
             self.statusBar.showMessage(f"Export failed: {str(e)}")
 
+    def _export_provider(self, name, out_path):
+        # Exports keep every column: they are the raw forensic record.
+        with open(out_path, "w", encoding="utf-8") as f:
+            for line in iter_shell_lines(self.device, provider_query_command(name)):
+                f.write(line + "\n")
+
     # ---------------------------- Settings / LLM ----------------------------
 
     def show_settings_page(self):
@@ -1456,6 +4285,24 @@ class DroidForen(QMainWindow):
         except Exception as e:
             return f"LLM call failed: {e}"
 
+    REPORT_LONGEST_SESSIONS = 50
+
+    def _report_usage_sessions(self, evidence_json):
+        """
+        Reconstructed sessions for the report: per-package totals, screen-on
+        time and the longest sessions, instead of every raw event.
+        """
+        cached = self.usage_sessions(load=False)
+        if cached is not None:
+            summary = summarize_usage_sessions(cached)
+            sessions = [s.to_dict() for s in cached]
+        else:
+            summary = dict(evidence_json.get("usage_sessions", {}))
+            sessions = summary.pop("sessions", [])
+        summary["longest_sessions"] = sorted(sessions, key=lambda s: s.get("seconds", 0),
+                                             reverse=True)[:self.REPORT_LONGEST_SESSIONS]
+        return summary
+
     def generate_report(self):
         ef = self.evidence_file_path()
         if not os.path.exists(ef):
@@ -1501,8 +4348,10 @@ class DroidForen(QMainWindow):
 
             s4 = header + (
                 "Section: Usage Stats Analysis\n"
-                "Explain foreground/background app events, session bursts, and correlate with other artifacts.\n"
-                f"Evidence:\n{json.dumps(evidence_json.get('usage_stats', []), indent=2)}"
+                "Sessions below were reconstructed from the usage events (foreground intervals per app, "
+                "screen-on intervals; durations in seconds, first/last as epoch seconds). "
+                "Interpret the usage pattern and session bursts, and correlate with other artifacts.\n"
+                f"Evidence:\n{json.dumps(self._report_usage_sessions(evidence_json), indent=2)}"
             )
             sections["Usage Stats"] = self._call_llm(llm, s4)
 